@@ -15,7 +15,8 @@ def create_dana_copywriter_agent(
     platform_tool: BaseTool,
     archetype_tool: BaseTool,
     temperature: float = None,
-    persona: str = None
+    persona: str = None,
+    bulk_platform_tool: BaseTool = None
 ) -> Agent:
     """
     Factory function to create Dana Copywriter agent with RAG tools.
@@ -27,6 +28,8 @@ def create_dana_copywriter_agent(
         archetype_tool: ChromaDB search tool for post archetype definitions
         temperature: Optional temperature override (persona-specific)
         persona: Optional persona name for customized behavior
+        bulk_platform_tool: Optional multi-query platform specs tool
+            (fetches all platform specs in one batched call)
 
     Returns:
         Agent configured with all necessary search tools
@@ -34,13 +37,17 @@ def create_dana_copywriter_agent(
     # Use provided temperature or default
     agent_temp = temperature if temperature is not None else AgentConfig.COPYWRITER_TEMPERATURE
 
+    tools = [voice_tool, style_tool, platform_tool, archetype_tool]
+    if bulk_platform_tool is not None:
+        tools.append(bulk_platform_tool)
+
     return Agent(
         role='Dana Copywriter',
         goal='Write 9 Hebrew social media posts based on the Campaign Bible.',
         backstory=f'''Hebrew copywriter in Dana's voice. Persona: {persona or "Professional Dana"}.
 SEARCH tools before writing: "Dana voice", "platform specifications", "post archetypes".
 Output: 9 posts (3 per platform), 100% Hebrew.''',
-        tools=[voice_tool, style_tool, platform_tool, archetype_tool],
+        tools=tools,
         llm=ChatOpenAI(
             model=AgentConfig.COPYWRITER_MODEL,
             temperature=agent_temp
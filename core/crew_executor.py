@@ -159,13 +159,21 @@ async def execute_crew_async(
             platform_tool=tools["platform_specs"],
             archetype_tool=tools["post_archetypes"],
             temperature=persona_temp,
-            persona=persona
+            persona=persona,
+            # The task prompt mandates one bulk call for all platform
+            # specs - the agent must carry the tool on this path too
+            bulk_platform_tool=tools.get("platform_specs_bulk")
         )
 
         update_progress("📋 יוצר משימות...", 0.2)
 
-        # Create tasks
-        strategy_task = create_strategy_task(strategy_architect, inputs)
+        # Create tasks - the strategy task pre-fetches its mandatory RAG
+        # context concurrently at construction time
+        strategy_task = create_strategy_task(
+            strategy_architect,
+            inputs,
+            methodology_tool=tools["methodology"]
+        )
         copywriting_task = create_copywriting_task(
             dana_copywriter,
             inputs,
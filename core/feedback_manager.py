@@ -541,6 +541,52 @@ def get_lab_queue(
         raise Exception(f"Failed to retrieve lab queue from Supabase: {str(e)}")
 
 
+def get_lab_queue_summary(
+    client_id: str,
+    agent_type: str = None,
+    offset: int = 0,
+    limit: int = 49,
+    db_path: str = None  # Kept for API compatibility (ignored)
+) -> List[Dict]:
+    """
+    Get lightweight metadata for lab queue items from Supabase
+
+    Unlike get_lab_queue, this skips the heavy fields (content,
+    raw_text_feedback) - use it for the "waiting" tail of the queue
+    where only id/category/rating/created_at are displayed.
+
+    Args:
+        client_id: Client identifier
+        agent_type: Optional agent type filter
+        offset: Number of items to skip from the head of the queue
+        limit: Maximum number of results (default: 49)
+        db_path: (Ignored - kept for API compatibility)
+
+    Returns:
+        List of metadata dicts, ordered by entry date (oldest first)
+    """
+    supabase = _get_supabase_client()
+
+    try:
+        query = supabase.table('feedback')\
+            .select('id, category, rating, created_at, lab_entry_date')\
+            .eq('client_id', client_id)\
+            .eq('status', 'pending_refinement')
+
+        if agent_type:
+            query = query.eq('agent_type', agent_type)
+
+        response = query.order('lab_entry_date', desc=False)\
+                       .order('created_at', desc=False)\
+                       .range(offset, offset + limit - 1)\
+                       .execute()
+
+        return response.data if response.data else []
+
+    except Exception as e:
+        raise Exception(f"Failed to retrieve lab queue summary from Supabase: {str(e)}")
+
+
 def auto_age_lab_items(
     days_threshold: int = 7,
     db_path: str = None  # Kept for API compatibility (ignored)
@@ -89,7 +89,7 @@ async def run_generation(inputs: dict, tools: dict, progress_placeholder, status
         CrewExecutionResult
     """
     from tools.chromadb_search_tool import (
-        get_chromadb_query_log,
+        get_chromadb_query_log_snapshot,
         clear_chromadb_query_log,
         clear_embedding_cache
     )
@@ -105,13 +105,13 @@ async def run_generation(inputs: dict, tools: dict, progress_placeholder, status
 
     def update_rag_log():
         """Update RAG log display."""
-        rag_queries = get_chromadb_query_log()
-        if rag_queries:
+        # Materialized snapshot - safe to iterate while the crew's
+        # worker thread keeps appending
+        rag_queries, log_len = get_chromadb_query_log_snapshot(last_n=10)
+        if log_len:
             log_text = ""
-            for query in rag_queries[-10:]:  # Show last 10 queries
-                tool = query.get('tool', 'unknown')
-                search = query.get('query', '')[:60]
-                log_text += f"**{tool}:** {search}...\n\n"
+            for tool, search, _ts in rag_queries:
+                log_text += f"**{tool}:** {search[:60]}...\n\n"
             rag_log_placeholder.markdown(log_text)
         else:
             rag_log_placeholder.caption("חיפושי RAG יופיעו כאן...")
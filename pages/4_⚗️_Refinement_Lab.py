@@ -7,6 +7,8 @@ This page processes PENDING_REFINEMENT feedback items with
 structured micro-prompts instead of free-form text.
 """
 
+import html
+
 import streamlit as st
 import json
 from datetime import datetime
@@ -15,6 +17,7 @@ from pathlib import Path
 from core.auth import require_authentication
 from core.feedback_manager import (
     get_lab_queue,
+    get_lab_queue_summary,
     update_status,
     get_feedback_by_id,
     auto_age_lab_items
@@ -35,17 +38,13 @@ load_custom_css()
 require_authentication()
 
 
-def get_structured_prompts(category: str) -> dict:
-    """
-    Get category-specific structured micro-prompts
-
-    Returns dict with:
-    - question: The main question
-    - options: List of checkbox options
-    - followup_prompt: Short text input prompt
-    """
-
-    prompts = {
+# Category-specific structured micro-prompts.
+# Each entry has:
+# - question: The main question
+# - options: List of checkbox options
+# - followup_question/followup_options: Optional second checkbox group
+# - text_prompt: Short text input prompt
+_STRUCTURED_PROMPTS = {
         "Tone": {
             "question": "❓ איזה חלק הרגיש לא נכון?",
             "options": [
@@ -133,16 +132,96 @@ def get_structured_prompts(category: str) -> dict:
             "followup_question": "",
             "followup_options": [],
             "text_prompt": "💬 הסבר את הבעיה (עד 20 מילים):"
-        }
     }
+}
+
 
-    return prompts.get(category, prompts["Other"])
+def get_structured_prompts(category: str) -> dict:
+    """Get category-specific structured micro-prompts (see _STRUCTURED_PROMPTS)."""
+    return _STRUCTURED_PROMPTS.get(category, _STRUCTURED_PROMPTS["Other"])
+
+
+def _render_text(prompts: dict, feedback_id):
+    """Render only the short text input (categories with no checkbox options)."""
+    st.markdown(f"**{prompts['text_prompt']}**")
+    text = st.text_input(
+        label="הסבר קצר",
+        max_chars=100,
+        key=f"c{feedback_id}t",
+        label_visibility="collapsed",
+        placeholder="מקסימום 10-15 מילים..."
+    )
+    return [], [], text
+
+
+def _render_options_and_text(prompts: dict, feedback_id):
+    """Render the main option group plus the short text input."""
+    selected_options = st.multiselect(
+        prompts['question'],
+        prompts["options"],
+        key=f"c{feedback_id}o"
+    )
+    _, _, text = _render_text(prompts, feedback_id)
+    return selected_options, [], text
+
+
+def _render_options_followup_and_text(prompts: dict, feedback_id):
+    """Render both option groups plus the short text input."""
+    selected_options = st.multiselect(
+        prompts['question'],
+        prompts["options"],
+        key=f"c{feedback_id}o"
+    )
+    selected_followup = st.multiselect(
+        prompts['followup_question'],
+        prompts["followup_options"],
+        key=f"c{feedback_id}f"
+    )
+    _, _, text = _render_text(prompts, feedback_id)
+    return selected_options, selected_followup, text
+
+
+def _make_handler(prompts: dict):
+    """Bind a category's prompts to the specialized renderer it actually needs."""
+    if not prompts["options"]:
+        renderer = _render_text
+    elif prompts["followup_options"]:
+        renderer = _render_options_followup_and_text
+    else:
+        renderer = _render_options_and_text
+
+    def handler(feedback_id):
+        return renderer(prompts, feedback_id)
+
+    return handler
+
+
+# Precomputed per-category handlers - avoids re-evaluating the
+# "does this category have options/followups?" branches on every rerun
+_PROMPT_HANDLERS = {
+    category: _make_handler(entry)
+    for category, entry in _STRUCTURED_PROMPTS.items()
+}
 
 
 def display_feedback_card(feedback: dict, card_index: int):
     """Display a single feedback item for refinement"""
 
+    # Unpack once - this function runs on every rerun
     feedback_id = feedback['id']
+    rating = feedback.get('rating', 0)
+    platform = feedback.get('platform', 'Unknown')
+    category = feedback.get('category', 'Unknown')
+    created = feedback.get('created_at', 'Unknown')[:10]
+    content = feedback.get('content', 'No content available')
+    original_feedback = feedback.get('raw_text_feedback', '(ריק)')
+    actionability = feedback.get('actionability_score', 0)
+
+    platform_emoji = {
+        'LinkedIn': '📘',
+        'Facebook': '📱',
+        'Instagram': '📸'
+    }.get(platform, '📄')
 
     st.markdown(f"""
     <div style="background: linear-gradient(135deg, #2D2D44 0%, #1E1E2E 100%);
@@ -159,49 +238,43 @@ def display_feedback_card(feedback: dict, card_index: int):
 
         with col_h1:
             st.markdown(f"**⚗️ Lab Item #{card_index + 1}**")
-            st.caption(f"ID: {feedback_id} | Created: {feedback.get('created_at', 'Unknown')[:10]}")
+            st.caption(f"ID: {feedback_id} | Created: {created}")
 
         with col_h2:
-            rating = feedback.get('rating', 0)
             st.markdown(f"**Rating:** {'⭐' * rating}")
 
         with col_h3:
-            platform = feedback.get('platform', 'Unknown')
-            # Add emoji based on platform
-            platform_emoji = {
-                'LinkedIn': '📘',
-                'Facebook': '📱',
-                'Instagram': '📸'
-            }.get(platform, '📄')
             st.markdown(f"**Platform:** {platform_emoji} {platform}")
 
         with col_h4:
-            category = feedback.get('category', 'Unknown')
             st.markdown(f"**Category:** {category}")
 
         st.divider()
 
-        # Original post content
-        platform = feedback.get('platform', 'Unknown')
-        platform_emoji = {
-            'LinkedIn': '📘',
-            'Facebook': '📱',
-            'Instagram': '📸'
-        }.get(platform, '📄')
+        # Original post content - truncated for long posts so every rerun
+        # doesn't re-serialize the full text; escaped (user-generated)
         st.markdown(f"### {platform_emoji} התוכן המקורי ({platform})")
+        show_full_key = f"full_{feedback_id}"
+        truncated = len(content) > 300 and not st.session_state.get(show_full_key)
+        shown = content[:300] + '…' if truncated else content
         st.markdown(f"""
         <div class="rtl-text" style="background: #2D2D44; padding: 15px; border-radius: 8px; white-space: pre-wrap; direction: rtl;">
-        {feedback.get('content', 'No content available')}
+        {html.escape(shown)}
         </div>
         """, unsafe_allow_html=True)
+        if truncated:
+            st.button(
+                "הצג הכל",
+                key=f"fullbtn_{feedback_id}",
+                on_click=st.session_state.__setitem__,
+                args=(show_full_key, True)
+            )
 
         # Original feedback
         st.markdown("### 💬 משוב ראשוני (מעורפל)")
-        original_feedback = feedback.get('raw_text_feedback', '(ריק)')
         st.info(f"📝 \"{original_feedback}\"")
 
         # Actionability info
-        actionability = feedback.get('actionability_score', 0)
         st.caption(f"🎯 Actionability Score: {actionability:.2f} (Low = needs refinement)")
 
         st.markdown("---")
@@ -210,118 +283,82 @@ def display_feedback_card(feedback: dict, card_index: int):
         st.markdown("### ⚗️ שיפור מובנה")
         st.caption("✨ עניני על התיבות והשדה הקצר למטה - זה יעזור למערכת ללמוד!")
 
-        # Get category-specific prompts
-        prompts = get_structured_prompts(category)
-
-        # Question 1: Main question with checkboxes
-        if prompts["options"]:
-            st.markdown(f"**{prompts['question']}**")
-            selected_options = []
-            for option in prompts["options"]:
-                if st.checkbox(option, key=f"opt_{feedback_id}_{option}"):
-                    selected_options.append(option)
+        # Stage the refinement inputs inside a form so checkbox toggles
+        # and typing stay client-side - only submit triggers a rerun.
+        # All three actions are submit buttons in the same form, dispatched
+        # through a single handler path below.
+        with st.form(f"refine_{feedback_id}", clear_on_submit=False):
+            # Dispatch to the precomputed category handler - only the widgets
+            # this category actually needs are emitted
+            handler = _PROMPT_HANDLERS.get(category, _PROMPT_HANDLERS["Other"])
+            selected_options, selected_followup, short_explanation = handler(feedback_id)
+
+            col_btn1, col_btn2, col_btn3 = st.columns(3)
+            with col_btn1:
+                save_clicked = st.form_submit_button("💾 שמור ואמן", type="primary", use_container_width=True)
+            with col_btn2:
+                skip_clicked = st.form_submit_button("⏭️ דלג (שמור AS-IS)", use_container_width=True)
+            with col_btn3:
+                discard_clicked = st.form_submit_button("🗑️ מחק", use_container_width=True)
+
+        if save_clicked:
+            action = ('approved', f"Refined in Lab: {short_explanation[:50]}", {
+                "category": category,
+                "selected_options": selected_options,
+                "selected_followup": selected_followup,
+                "short_explanation": short_explanation,
+                "refined_at": datetime.now().isoformat()
+            })
+        elif skip_clicked:
+            action = ('skipped', "Skipped refinement - saved original vague feedback", None)
+        elif discard_clicked:
+            action = ('discarded', "Discarded - not useful", None)
         else:
-            selected_options = []
-
-        # Question 2: Followup question (if applicable)
-        selected_followup = []
-        if prompts["followup_options"]:
-            st.markdown(f"**{prompts['followup_question']}**")
-            for option in prompts["followup_options"]:
-                if st.checkbox(option, key=f"followup_{feedback_id}_{option}"):
-                    selected_followup.append(option)
-
-        # Short text explanation
-        st.markdown(f"**{prompts['text_prompt']}**")
-        short_explanation = st.text_input(
-            label="הסבר קצר",
-            max_chars=100,
-            key=f"text_{feedback_id}",
-            label_visibility="collapsed",
-            placeholder="מקסימום 10-15 מילים..."
-        )
-
-        st.divider()
-
-        # Action buttons
-        col_btn1, col_btn2, col_btn3 = st.columns(3)
-
-        with col_btn1:
-            if st.button("💾 שמור ואמן", key=f"save_{feedback_id}", type="primary", use_container_width=True):
-                # Build refinement data
-                refinement_data = {
-                    "category": category,
-                    "selected_options": selected_options,
-                    "selected_followup": selected_followup,
-                    "short_explanation": short_explanation,
-                    "refined_at": datetime.now().isoformat()
-                }
-
-                try:
-                    # Update status to APPROVED and save refinement data
-                    update_status(
-                        feedback_id=feedback_id,
-                        new_status='approved',  # Promote to approved
-                        notes=f"Refined in Lab: {short_explanation[:50]}",
-                        refinement_data=refinement_data
-                    )
-
+            action = None
+
+        if action:
+            new_status, notes, refinement_data = action
+            try:
+                update_status(
+                    feedback_id=feedback_id,
+                    new_status=new_status,
+                    notes=notes,
+                    refinement_data=refinement_data
+                )
+
+                if new_status == 'approved':
                     st.success("✅ פידבק שופר ונשמר למערכת הלמידה!")
                     st.balloons()
-
-                    # Remove from session state queue
-                    if 'lab_queue' in st.session_state:
-                        st.session_state.lab_queue = [f for f in st.session_state.lab_queue if f['id'] != feedback_id]
-
-                    st.rerun()
-
-                except Exception as e:
-                    st.error(f"❌ שגיאה בשמירה: {str(e)}")
-
-        with col_btn2:
-            if st.button("⏭️ דלג (שמור AS-IS)", key=f"skip_{feedback_id}", use_container_width=True):
-                try:
-                    update_status(
-                        feedback_id=feedback_id,
-                        new_status='SKIPPED',
-                        notes="Skipped refinement - saved original vague feedback"
-                    )
-
+                elif new_status == 'skipped':
                     st.info("ℹ️ פידבק נשמר ללא שיפור")
-
-                    # Remove from queue
-                    if 'lab_queue' in st.session_state:
-                        st.session_state.lab_queue = [f for f in st.session_state.lab_queue if f['id'] != feedback_id]
-
-                    st.rerun()
-
-                except Exception as e:
-                    st.error(f"❌ שגיאה: {str(e)}")
-
-        with col_btn3:
-            if st.button("🗑️ מחק", key=f"discard_{feedback_id}", use_container_width=True):
-                try:
-                    update_status(
-                        feedback_id=feedback_id,
-                        new_status='DISCARDED',
-                        notes="Discarded - not useful"
-                    )
-
+                else:
                     st.warning("⚠️ פידבק נמחק")
 
-                    # Remove from queue
-                    if 'lab_queue' in st.session_state:
-                        st.session_state.lab_queue = [f for f in st.session_state.lab_queue if f['id'] != feedback_id]
+                # Remove from session state queue
+                if 'lab_queue' in st.session_state:
+                    st.session_state.lab_queue = [f for f in st.session_state.lab_queue if f['id'] != feedback_id]
 
-                    st.rerun()
+                st.rerun()
 
-                except Exception as e:
-                    st.error(f"❌ שגיאה: {str(e)}")
+            except Exception as e:
+                st.error(f"❌ שגיאה: {str(e)}")
 
     # Close card div
     st.markdown("</div>", unsafe_allow_html=True)
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _run_auto_aging() -> int:
+    """
+    Run lab auto-aging at most once per hour per process.
+
+    Aging is a maintenance write that doesn't need to run on every
+    widget-triggered rerun - the cache TTL keeps the storage scan off
+    the hot path.
+    """
+    return auto_age_lab_items(days_threshold=7)
+
+
 def main():
     """The Refinement Lab - Structured feedback clarification workspace"""
 
@@ -336,10 +373,11 @@ def main():
     - ⏭️ פידבקים שנמצאים כאן יותר מ-7 ימים → מתודלגים אוטומטית
     """)
 
-    # Run auto-aging (cleanup old items)
+    # Run auto-aging (cleanup old items) - cached, so reruns don't re-scan
     try:
-        aged_count = auto_age_lab_items(days_threshold=7)
-        if aged_count > 0:
+        aged_count = _run_auto_aging()
+        if aged_count > 0 and 'aging_shown' not in st.session_state:
+            st.session_state['aging_shown'] = True
             st.info(f"🕒 {aged_count} פידבקים ישנים (>7 ימים) דולגו אוטומטית")
     except Exception as e:
         st.caption(f"⚠️ Auto-aging failed: {str(e)}")
@@ -361,20 +399,26 @@ def main():
     is_page_first_load = page_key not in st.session_state
     
     # Load lab queue if needed
-    # Always load on first page visit, refresh button, or client change
-    if is_page_first_load or should_refresh or client_changed:
+    # Always load on first page visit, refresh button, or client change,
+    # or once the interactive head item has been processed
+    head_done = not st.session_state.get('lab_queue') and st.session_state.get('lab_tail')
+    if is_page_first_load or should_refresh or client_changed or head_done:
         try:
-            queue = get_lab_queue(client_id=client_id, limit=50)
-            st.session_state.lab_queue = queue
+            # Only the head item is interactive - fetch it in full and pull
+            # lightweight metadata for the rest of the queue
+            st.session_state.lab_queue = get_lab_queue(client_id=client_id, limit=1)
+            st.session_state.lab_tail = get_lab_queue_summary(client_id=client_id, offset=1, limit=49)
             st.session_state.lab_queue_client = client_id
             st.session_state[page_key] = True  # Mark that we've loaded for this client
         except Exception as e:
             st.error(f"❌ שגיאה בטעינת התור: {str(e)}")
             st.session_state.lab_queue = []
+            st.session_state.lab_tail = []
             st.session_state.lab_queue_client = client_id
             st.session_state[page_key] = True
 
     queue = st.session_state.get('lab_queue', [])
+    tail = st.session_state.get('lab_tail', [])
 
     # Show queue status
     if not queue:
@@ -387,8 +431,9 @@ def main():
         st.stop()
 
     # Queue header
-    st.markdown(f"### 📋 התור ({len(queue)} פריטים)")
-    st.progress(0 if not queue else min(1.0, 1 / len(queue)))
+    total = len(queue) + len(tail)
+    st.markdown(f"### 📋 התור ({total} פריטים)")
+    st.progress(min(1.0, 1 / total))
 
     st.divider()
 
@@ -397,9 +442,9 @@ def main():
     display_feedback_card(queue[0], 0)
 
     # Show remaining items in expander
-    if len(queue) > 1:
-        with st.expander(f"📦 עוד {len(queue) - 1} פריטים ממתינים"):
-            for i, item in enumerate(queue[1:], start=1):
+    if tail:
+        with st.expander(f"📦 עוד {len(tail)} פריטים ממתינים"):
+            for i, item in enumerate(tail, start=1):
                 st.caption(f"**#{i+1}**: {item.get('category')} | Rating: {item.get('rating')}⭐ | Created: {item.get('created_at', '')[:10]}")
 
 
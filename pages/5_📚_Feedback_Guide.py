@@ -23,6 +23,153 @@ load_custom_css()
 # Require authentication
 require_authentication()
 
+# Status labels for the stats breakdown (hoisted - no need to rebuild per render)
+_STATUS_NAMES = {
+    'approved': '✅ מאושר',
+    'pending': '⏳ ממתין',
+    'pending_refinement': '⚗️ מעבדה',
+    'flagged': '🚩 מסומן',
+    'skipped': '⏭️ דולג',
+    'rejected': '❌ נדחה',
+    'discarded': '🗑️ הושלך'
+}
+
+
+# FAQ content (title, body, session-state key). Bodies are only
+# serialized to the frontend after the user opens the question.
+_FAQ_ITEMS = [
+    ("❓ למה הפידבק שלי נשלח למעבדה ולא אושר ישירות?", """
+    **סיבות אפשריות:**
+    - דירוג ביניים (3) ללא הסבר מפורט
+    - משוב קצר מדי (<20 תווים)
+    - ציון actionability נמוך
+    - קטגוריה "Other" עם משוב עמום
+
+    **מה לעשות?**
+    גש למעבדת השיפור ושפר את הפידבק עם השאלון המודרך.
+    """, "faq_lab"),
+
+    ("❓ מה ההבדל בין Confidence ל-Actionability?", """
+    - **Confidence (אמינות)**: עד כמה אפשר לסמוך על הפידבק? (בהתבסס על הקשר, עקביות, ספציפיות)
+    - **Actionability (ניתן לפעולה)**: עד כמה ניתן ללמוד ממנו משהו קונקרטי? (בהתבסס על ניתוח LLM)
+
+    **דוגמה:**
+    - "לא טוב" = Confidence גבוה (אם עקבי) + Actionability נמוך (לא ברור מה לשנות)
+    - "הפתיחה רשמית מדי, תתחיל ב-hook" = Confidence גבוה + Actionability גבוה
+    """, "faq_scores"),
+
+    ("❓ מה קורה אם אני לא משפר פידבק שבמעבדה?", """
+    **אחרי 7 ימים** הפידבק משתנה אוטומטית ל-`status='skipped'` (דולג).
+
+    **למה?**
+    - מונע הצטברות של פידבקים ישנים
+    - שומר על המעבדה רלוונטית
+    - פידבק שלא שופרו תוך שבוע כנראה לא רלוונטיים יותר
+
+    **האם אפשר לשחזר?**
+    כן, אפשר לשנות ידנית את הסטטוס בבסיס הנתונים (רק למפתחים).
+    """, "faq_aging"),
+
+    ("❓ איך דנה משתמשת בפידבק בפועל?", """
+    **תהליך הלמידה:**
+    1. **בזמן ייצור תוכן** - דנה מחפשת בקובץ `Data/feedback_learnings_copywriter.txt`
+    2. **RAG Search** - מוצאת דפוסים רלוונטיים (לפי פלטפורמה, ארכיטייפ, פרסונה)
+    3. **יישום** - משלבת את הדפוסים בכתיבה
+
+    **דוגמה:**
+    - פידבק: "אל תשתמש במילה 'מהפכני' - תגיד 'חדשני'" (LinkedIn, Tone, ⭐⭐⭐⭐⭐)
+    - נשמר כדפוס: "LinkedIn + Tone → נמנע מ-'מהפכני', משתמש ב-'חדשני'"
+    - בייצור הבא: דנה רואה את הדפוס ונמנעת מהמילה 'מהפכני' בפוסטים ל-LinkedIn
+    """, "faq_usage"),
+
+    ("❓ האם אפשר למחוק פידבק?", """
+    **כרגע לא ישירות מהממשק.**
+
+    אבל אפשר לשנות status ל-`discarded` (מושלך):
+    ```python
+    from core.feedback_manager import update_status
+    update_status(feedback_id=123, new_status='discarded', notes='לא רלוונטי')
+    ```
+
+    פידבקים עם `status='discarded'` לא משתתפים בלמידה.
+    """, "faq_delete"),
+]
+
+
+def _lazy_expander(title: str, body: str, key: str):
+    """Render an expander whose body is emitted only once it's been opened.
+
+    Collapsed st.expander still serializes its full body to the frontend;
+    showing a button until first open keeps unopened FAQ bodies out of
+    the page payload.
+    """
+    if st.session_state.get(key):
+        with st.expander(title, expanded=True):
+            st.markdown(body)
+    elif st.button(title, key=f"btn_{key}", use_container_width=True):
+        st.session_state[key] = True
+        st.rerun()
+
+
+@st.fragment
+def _render_faq():
+    """FAQ section - fragment-scoped so opening a question reruns only this block."""
+    st.markdown("## ❓ שאלות נפוצות")
+    for title, body, key in _FAQ_ITEMS:
+        _lazy_expander(title, body, key)
+
+
+@st.fragment
+def _render_stats_block():
+    """Current feedback counts - fragment-scoped so a stats refresh
+    doesn't re-render the whole guide."""
+    st.markdown("## 📈 כמה פידבקים יש כרגע?")
+
+    try:
+        from core.feedback_manager import get_feedback_stats
+
+        client_id = st.session_state.get('selected_client', 'Lierac')
+        stats = get_feedback_stats(client_id=client_id)
+
+        col_stat1, col_stat2, col_stat3, col_stat4 = st.columns(4)
+
+        with col_stat1:
+            st.metric("סה\"כ פידבקים", stats['total'])
+
+        with col_stat2:
+            approved = stats['by_status'].get('approved', 0)
+            st.metric("מאושרים (ללמידה)", approved)
+
+        with col_stat3:
+            pending_ref = stats['by_status'].get('pending_refinement', 0)
+            st.metric("במעבדת שיפור", pending_ref)
+
+        with col_stat4:
+            st.metric("ציון ממוצע", f"{stats['avg_rating']:.1f}/5")
+
+        # Show status breakdown
+        st.markdown("### פילוח לפי סטטוס:")
+        for status, count in stats['by_status'].items():
+            status_label = _STATUS_NAMES.get(status, status)
+            st.caption(f"{status_label}: {count}")
+
+    except Exception as e:
+        st.warning(f"לא ניתן לטעון סטטיסטיקות: {str(e)}")
+
+
+@st.fragment
+def _render_nav():
+    """Footer navigation - fragment-scoped so a click reruns only this block."""
+    col_back, col_lab = st.columns(2)
+
+    with col_back:
+        if st.button("← חזרה ל-Editor's Desk", use_container_width=True):
+            st.switch_page("pages/3_✍️_Editors_Desk.py")
+
+    with col_lab:
+        if st.button("⚗️ מעבדת השיפור →", use_container_width=True, type="primary"):
+            st.switch_page("pages/4_⚗️_Refinement_Lab.py")
+
 
 def main():
     """Feedback System Guide - Educational page."""
@@ -352,48 +499,7 @@ def main():
     st.markdown("---")
 
     # Statistics
-    st.markdown("## 📈 כמה פידבקים יש כרגע?")
-
-    try:
-        from core.feedback_manager import get_feedback_stats
-
-        client_id = st.session_state.get('selected_client', 'Lierac')
-        stats = get_feedback_stats(client_id=client_id)
-
-        col_stat1, col_stat2, col_stat3, col_stat4 = st.columns(4)
-
-        with col_stat1:
-            st.metric("סה\"כ פידבקים", stats['total'])
-
-        with col_stat2:
-            approved = stats['by_status'].get('approved', 0)
-            st.metric("מאושרים (ללמידה)", approved)
-
-        with col_stat3:
-            pending_ref = stats['by_status'].get('pending_refinement', 0)
-            st.metric("במעבדת שיפור", pending_ref)
-
-        with col_stat4:
-            st.metric("ציון ממוצע", f"{stats['avg_rating']:.1f}/5")
-
-        # Show status breakdown
-        st.markdown("### פילוח לפי סטטוס:")
-        status_names = {
-            'approved': '✅ מאושר',
-            'pending': '⏳ ממתין',
-            'pending_refinement': '⚗️ מעבדה',
-            'flagged': '🚩 מסומן',
-            'skipped': '⏭️ דולג',
-            'rejected': '❌ נדחה',
-            'discarded': '🗑️ הושלך'
-        }
-
-        for status, count in stats['by_status'].items():
-            status_label = status_names.get(status, status)
-            st.caption(f"{status_label}: {count}")
-
-    except Exception as e:
-        st.warning(f"לא ניתן לטעון סטטיסטיקות: {str(e)}")
+    _render_stats_block()
 
     st.markdown("---")
 
@@ -422,68 +528,7 @@ def main():
     st.markdown("---")
 
     # FAQ
-    st.markdown("## ❓ שאלות נפוצות")
-
-    with st.expander("❓ למה הפידבק שלי נשלח למעבדה ולא אושר ישירות?"):
-        st.markdown("""
-        **סיבות אפשריות:**
-        - דירוג ביניים (3) ללא הסבר מפורט
-        - משוב קצר מדי (<20 תווים)
-        - ציון actionability נמוך
-        - קטגוריה "Other" עם משוב עמום
-
-        **מה לעשות?**
-        גש למעבדת השיפור ושפר את הפידבק עם השאלון המודרך.
-        """)
-
-    with st.expander("❓ מה ההבדל בין Confidence ל-Actionability?"):
-        st.markdown("""
-        - **Confidence (אמינות)**: עד כמה אפשר לסמוך על הפידבק? (בהתבסס על הקשר, עקביות, ספציפיות)
-        - **Actionability (ניתן לפעולה)**: עד כמה ניתן ללמוד ממנו משהו קונקרטי? (בהתבסס על ניתוח LLM)
-
-        **דוגמה:**
-        - "לא טוב" = Confidence גבוה (אם עקבי) + Actionability נמוך (לא ברור מה לשנות)
-        - "הפתיחה רשמית מדי, תתחיל ב-hook" = Confidence גבוה + Actionability גבוה
-        """)
-
-    with st.expander("❓ מה קורה אם אני לא משפר פידבק שבמעבדה?"):
-        st.markdown("""
-        **אחרי 7 ימים** הפידבק משתנה אוטומטית ל-`status='skipped'` (דולג).
-
-        **למה?**
-        - מונע הצטברות של פידבקים ישנים
-        - שומר על המעבדה רלוונטית
-        - פידבק שלא שופרו תוך שבוע כנראה לא רלוונטיים יותר
-
-        **האם אפשר לשחזר?**
-        כן, אפשר לשנות ידנית את הסטטוס בבסיס הנתונים (רק למפתחים).
-        """)
-
-    with st.expander("❓ איך דנה משתמשת בפידבק בפועל?"):
-        st.markdown("""
-        **תהליך הלמידה:**
-        1. **בזמן ייצור תוכן** - דנה מחפשת בקובץ `Data/feedback_learnings_copywriter.txt`
-        2. **RAG Search** - מוצאת דפוסים רלוונטיים (לפי פלטפורמה, ארכיטייפ, פרסונה)
-        3. **יישום** - משלבת את הדפוסים בכתיבה
-
-        **דוגמה:**
-        - פידבק: "אל תשתמש במילה 'מהפכני' - תגיד 'חדשני'" (LinkedIn, Tone, ⭐⭐⭐⭐⭐)
-        - נשמר כדפוס: "LinkedIn + Tone → נמנע מ-'מהפכני', משתמש ב-'חדשני'"
-        - בייצור הבא: דנה רואה את הדפוס ונמנעת מהמילה 'מהפכני' בפוסטים ל-LinkedIn
-        """)
-
-    with st.expander("❓ האם אפשר למחוק פידבק?"):
-        st.markdown("""
-        **כרגע לא ישירות מהממשק.**
-
-        אבל אפשר לשנות status ל-`discarded` (מושלך):
-        ```python
-        from core.feedback_manager import update_status
-        update_status(feedback_id=123, new_status='discarded', notes='לא רלוונטי')
-        ```
-
-        פידבקים עם `status='discarded'` לא משתתפים בלמידה.
-        """)
+    _render_faq()
 
     st.markdown("---")
 
@@ -503,15 +548,7 @@ def main():
     st.markdown("---")
 
     # Navigation
-    col_back, col_lab = st.columns(2)
-
-    with col_back:
-        if st.button("← חזרה ל-Editor's Desk", use_container_width=True):
-            st.switch_page("pages/3_✍️_Editors_Desk.py")
-
-    with col_lab:
-        if st.button("⚗️ מעבדת השיפור →", use_container_width=True, type="primary"):
-            st.switch_page("pages/4_⚗️_Refinement_Lab.py")
+    _render_nav()
 
 
 if __name__ == "__main__":
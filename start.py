@@ -7,12 +7,12 @@ Version: 1.1 - Enhanced with thread safety, timeouts, and validation
 
 import sys
 import io
+import re
 import chainlit as cl
 from chainlit.input_widget import Select, TextInput
 from crewai import Crew, Process
 import os
 import asyncio
-import threading
 import time
 from pathlib import Path
 from dotenv import load_dotenv
@@ -35,85 +35,155 @@ from tasks.copywriting_tasks import create_copywriting_task
 
 # Import TXTSearchTool initialization
 from tools.txt_search_tools import initialize_all_tools
+from tools.chromadb_search_tool import prewarm_embedding_cache
 
 # Import configuration and models
-from config import ExecutionConfig, ChainlitConfig, AgentConfig
+from config import ExecutionConfig, ChainlitConfig, AgentConfig, PersonaConfig
 from models import CampaignInput, OutputMetadata
 from datetime import datetime
+from types import MappingProxyType
 
-# Initialize tools ONCE at startup (global state) with thread safety
+# Initialize tools eagerly at module import (initialization-on-demand
+# holder). initialize_all_tools runs exactly once per process and the
+# result is shared by every chat, so no locking is needed - chat start
+# just reads the already-built dict. Set DANA_SKIP_EAGER_INIT to defer
+# (e.g. for test runs that never touch the tools).
 TOOLS: Optional[Dict] = None
-TOOLS_LOCK = threading.Lock()
+TOOLS_INIT_ERROR: Optional[Exception] = None
+
+if not os.getenv("DANA_SKIP_EAGER_INIT"):
+    try:
+        TOOLS = initialize_all_tools()
+    except Exception as e:
+        TOOLS_INIT_ERROR = e
+
+
+def _ensure_tools() -> Optional[Dict]:
+    """Retry tool initialization if the eager import-time attempt failed.
+
+    A transient error at boot (network blip during the embedding
+    prewarm, locked file) must not poison every subsequent chat - each
+    chat start gets a fresh attempt until one succeeds.
+    """
+    global TOOLS, TOOLS_INIT_ERROR
+    if TOOLS is None:
+        try:
+            TOOLS = initialize_all_tools()
+            TOOLS_INIT_ERROR = None
+        except Exception as e:
+            TOOLS_INIT_ERROR = e
+    return TOOLS
+
+
+def _format_tools_init_error(e: Optional[Exception]) -> str:
+    """Format a tools-initialization failure for display to the user."""
+    if isinstance(e, UnicodeDecodeError):
+        return f"❌ **שגיאת קידוד קובץ**\n\n{e.reason}\n\n**המלצה:** שמרו את כל קבצי Data/ בקידוד UTF-8."
+    if isinstance(e, (FileNotFoundError, RuntimeError)):
+        return str(e)
+    return f"❌ **שגיאה בלתי צפויה**\n\n{str(e)}\n\n**המלצה:** בדקו את הלוגים או הפעילו מחדש את האפליקציה."
+
+# Strips anything that isn't word-char/space/hyphen from filenames
+# (\w in Unicode mode covers Hebrew, matching the old isalnum() filter)
+_SAFE_CHARS_RE = re.compile(r'[^\w \-]')
+
+# Static tail of the output MD file
+_MD_FOOTER = """
+
+---
+
+## 💡 הערות לשימוש
+
+- **העתקה מהירה:** כל פוסט מסומן בפלטפורמה שלו (LinkedIn/Facebook/Instagram)
+- **עריכה:** ניתן לערוך את הפוסטים בהתאם לצרכים ספציפיים
+- **פרסום:** כל פוסט מותאם לפורמט ולטון של הפלטפורמה שלו
+
+---
+
+**🤖 נוצר על ידי Dana's Brain** - מערכת AI לייצור תוכן שיווקי
+מופעל באמצעות Chainlit + CrewAI עם RAG (Retrieval-Augmented Generation)
+"""
+
+# Persona descriptions for the output MD metadata (frozen - built once per process)
+_PERSONA_DESCRIPTIONS = MappingProxyType({
+    "Professional Dana": "טון מקצועי וממוקד, דאטה-דריבן, מדגיש תועלות ועובדות, סגנון של מנהיגות מחשבתית (Thought Leadership)",
+    "Friendly Dana": "טון חברותי ושיחתי, קול של 'חברה הכי טובה', סיפורים אישיים, קז'ואל אבל מקצועי",
+    "Inspirational Dana": "מוטיבציה והעצמה, מסרים שאפתניים, חיבור רגשי, פוקוס על טרנספורמציה",
+    "Mentor Dana": "טון מנחה וחינוכי, עצות תומכות, גישה לימודית, מומחיות מטפחת"
+})
+
+# Filename-safe persona slugs, precomputed for the four known personas
+_PERSONA_SAFE_NAME = {name: name.replace(' ', '_') for name in _PERSONA_DESCRIPTIONS}
+
+# Character limits per input field (mirrors CampaignInput constraints)
+_FIELD_LIMITS = {
+    'product': 200,
+    'benefits': 1000,
+    'audience': 500,
+    'offer': 300
+}
+
+# Full persona labels shown in the Select widget; persona name is the
+# part before the dash. Interned so map lookups hit pointer equality
+# instead of comparing the full label character by character.
+_PERSONA_SELECT_VALUES = tuple(sys.intern(s) for s in (
+    "Professional Dana - Professional tone, data-driven, emphasizing benefits and facts, thought leadership style",
+    "Friendly Dana - Warm conversational tone, 'best friend' voice, personal stories, casual yet expert",
+    "Inspirational Dana - Motivational and empowering, aspirational messaging, emotional connection, transformative focus",
+    "Mentor Dana - Guiding and educational tone, supportive advice, teaching approach, nurturing expertise"
+))
+_DEFAULT_PERSONA_FULL = _PERSONA_SELECT_VALUES[1]
+
+# Single dict lookup instead of scanning the full label on every request
+_PERSONA_FULL_TO_NAME = {full: full.split(" - ", 1)[0] for full in _PERSONA_SELECT_VALUES}
+
+# Chat settings schema is static - build the widgets once per process
+# instead of five constructions (plus validation) per new chat
+_CHAT_SETTINGS_WIDGETS = [
+    TextInput(
+        id="product",
+        label="Product Name / Service (Max 200 chars)",
+        placeholder="Example: Lierac Hydragenist Serum",
+        description="Product or service name (1-200 characters)"
+    ),
+    TextInput(
+        id="benefits",
+        label="Key Benefits (Max 1000 chars)",
+        placeholder="Example: Deep hydration, instant glow, natural ingredients, clinically tested formula...",
+        description="List the main benefits - be concise but thorough (10-1000 characters)"
+    ),
+    TextInput(
+        id="audience",
+        label="Target Audience (Max 500 chars)",
+        placeholder="Example: Women 35-50, interested in anti-aging, skincare enthusiasts",
+        description="Describe your target audience (5-500 characters)"
+    ),
+    TextInput(
+        id="offer",
+        label="The Offer (Max 300 chars)",
+        placeholder="Example: 25% discount + free shipping on first order",
+        description="Your promotional offer or call-to-action (1-300 characters)"
+    ),
+    Select(
+        id="persona",
+        label="Select Dana Persona",
+        values=list(_PERSONA_SELECT_VALUES),
+        initial_value=_DEFAULT_PERSONA_FULL
+    )
+]
 
 
 @cl.on_chat_start
 async def start():
-    """Initialize chat with form inputs and tools (thread-safe)"""
-    global TOOLS
+    """Initialize chat with form inputs (tools are built at import)"""
 
-    # Initialize TXTSearchTools on first run (with thread safety)
-    if TOOLS is None:
-        with TOOLS_LOCK:
-            # Double-check after acquiring lock
-            if TOOLS is None:
-                await cl.Message(content="🔧 מאתחל כלי חיפוש במאגר הידע...").send()
-                try:
-                    TOOLS = await cl.make_async(initialize_all_tools)()
-                    await cl.Message(content="✅ כלי החיפוש מוכנים! מאגר הידע הופעל בהצלחה.").send()
-
-                except FileNotFoundError as e:
-                    await cl.Message(content=str(e)).send()
-                    return
-
-                except UnicodeDecodeError as e:
-                    await cl.Message(content=f"❌ **שגיאת קידוד קובץ**\n\n{e.reason}\n\n**המלצה:** שמרו את כל קבצי Data/ בקידוד UTF-8.").send()
-                    return
-
-                except RuntimeError as e:
-                    await cl.Message(content=str(e)).send()
-                    return
-
-                except Exception as e:
-                    await cl.Message(content=f"❌ **שגיאה בלתי צפויה**\n\n{str(e)}\n\n**המלצה:** בדקו את הלוגים או הפעילו מחדש את האפליקציה.").send()
-                    return
-
-    settings = await cl.ChatSettings([
-        TextInput(
-            id="product",
-            label="Product Name / Service (Max 200 chars)",
-            placeholder="Example: Lierac Hydragenist Serum",
-            description="Product or service name (1-200 characters)"
-        ),
-        TextInput(
-            id="benefits",
-            label="Key Benefits (Max 1000 chars)",
-            placeholder="Example: Deep hydration, instant glow, natural ingredients, clinically tested formula...",
-            description="List the main benefits - be concise but thorough (10-1000 characters)"
-        ),
-        TextInput(
-            id="audience",
-            label="Target Audience (Max 500 chars)",
-            placeholder="Example: Women 35-50, interested in anti-aging, skincare enthusiasts",
-            description="Describe your target audience (5-500 characters)"
-        ),
-        TextInput(
-            id="offer",
-            label="The Offer (Max 300 chars)",
-            placeholder="Example: 25% discount + free shipping on first order",
-            description="Your promotional offer or call-to-action (1-300 characters)"
-        ),
-        Select(
-            id="persona",
-            label="Select Dana Persona",
-            values=[
-                "Professional Dana - Professional tone, data-driven, emphasizing benefits and facts, thought leadership style",
-                "Friendly Dana - Warm conversational tone, 'best friend' voice, personal stories, casual yet expert",
-                "Inspirational Dana - Motivational and empowering, aspirational messaging, emotional connection, transformative focus",
-                "Mentor Dana - Guiding and educational tone, supportive advice, teaching approach, nurturing expertise"
-            ],
-            initial_value="Friendly Dana - Warm conversational tone, 'best friend' voice, personal stories, casual yet expert"
-        )
-    ]).send()
+    # Tools are built eagerly at module import; retry here so a
+    # transient boot failure doesn't require a process restart
+    if _ensure_tools() is None:
+        await cl.Message(content=_format_tools_init_error(TOOLS_INIT_ERROR)).send()
+        return
+
+    settings = await cl.ChatSettings(_CHAT_SETTINGS_WIDGETS).send()
 
     cl.user_session.set("settings", settings)
 
@@ -154,6 +224,37 @@ async def update_settings(settings):
     cl.user_session.set("settings", settings)
 
 
+# Candidate attribute names for crew/task output extraction, frozen once
+_AGENT_NAME_ATTRS = ("agent_role", "agent_name")
+_TASK_OUTPUT_ATTRS = ("output", "raw", "result", "final_answer")
+_RESULT_PAYLOAD_ATTRS = ("raw", "output", "result", "final_answer", "text")
+
+
+def safe_attr(obj, names, default=""):
+    """Return the first truthy attribute from names (no hasattr pre-probe)."""
+    for name in names:
+        val = getattr(obj, name, None)
+        if val:
+            return val
+    return default
+
+
+def first_non_empty(*vals):
+    for v in vals:
+        if v:
+            return v
+    return "(no output captured)"
+
+
+def get_result_payload(res):
+    """Prefer the fields that contain the crew final answer."""
+    for attr in _RESULT_PAYLOAD_ATTRS:
+        val = getattr(res, attr, None)
+        if val:
+            return val
+    return None
+
+
 def get_temperature_description_hebrew(temp: float) -> str:
     """Convert temperature value to user-friendly Hebrew description"""
     if temp <= 0.4:
@@ -177,8 +278,9 @@ async def save_output_to_file(product, persona, content, strategy, temperature=N
 
         # Generate filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_product = "".join(c for c in product if c.isalnum() or c in (' ', '-', '_')).strip()[:50]
-        filename = f"{timestamp}_{safe_product}_{persona.replace(' ', '_')}.md"
+        safe_product = _SAFE_CHARS_RE.sub('', product).strip()[:50]
+        persona_slug = _PERSONA_SAFE_NAME.get(persona) or persona.replace(' ', '_')
+        filename = f"{timestamp}_{safe_product}_{persona_slug}.md"
         filepath = output_dir / filename
 
         # Get persona details from config
@@ -191,27 +293,16 @@ async def save_output_to_file(product, persona, content, strategy, temperature=N
             temperature_display = f"**רמת יצירתיות:** {temp_hebrew} (Temperature: {temperature})\n"
 
         # Get persona-specific search terms and description from config
-        try:
-            from config import PersonaConfig
-            if persona in PersonaConfig.PERSONA_SEARCH_TERMS:
-                terms = PersonaConfig.PERSONA_SEARCH_TERMS[persona]
-                tone_terms = ', '.join(terms.get('tone', []))
-                style_terms = ', '.join(terms.get('style', []))
-                search_terms_display = f"""**מונחי חיפוש שנעשה שימוש בהם:**
+        if persona in PersonaConfig.PERSONA_SEARCH_TERMS:
+            terms = PersonaConfig.PERSONA_SEARCH_TERMS[persona]
+            tone_terms = ', '.join(terms.get('tone', []))
+            style_terms = ', '.join(terms.get('style', []))
+            search_terms_display = f"""**מונחי חיפוש שנעשה שימוש בהם:**
 - **טון (Tone):** {tone_terms}
 - **סגנון (Style):** {style_terms}
 """
 
-                # Get persona description based on persona name
-                persona_descriptions = {
-                    "Professional Dana": "טון מקצועי וממוקד, דאטה-דריבן, מדגיש תועלות ועובדות, סגנון של מנהיגות מחשבתית (Thought Leadership)",
-                    "Friendly Dana": "טון חברותי ושיחתי, קול של 'חברה הכי טובה', סיפורים אישיים, קז'ואל אבל מקצועי",
-                    "Inspirational Dana": "מוטיבציה והעצמה, מסרים שאפתניים, חיבור רגשי, פוקוס על טרנספורמציה",
-                    "Mentor Dana": "טון מנחה וחינוכי, עצות תומכות, גישה לימודית, מומחיות מטפחת"
-                }
-                persona_description = persona_descriptions.get(persona, "")
-        except:
-            pass
+            persona_description = _PERSONA_DESCRIPTIONS.get(persona, "")
 
         # Format execution time
         exec_time_display = ""
@@ -223,8 +314,10 @@ async def save_output_to_file(product, persona, content, strategy, temperature=N
             else:
                 exec_time_display = f"**זמן ביצוע:** {execution_time:.1f} שניות\n"
 
-        # Format markdown content with enhanced metadata
-        md_content = f"""# תוכן שיווקי - Dana's Brain
+        # Assemble the MD content block by block - one join, no repeated
+        # intermediate concatenations; the static footer is a module constant
+        parts = [
+            f"""# תוכן שיווקי - Dana's Brain
 
 **נוצר בתאריך:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 **מוצר:** {product}
@@ -248,32 +341,19 @@ async def save_output_to_file(product, persona, content, strategy, temperature=N
 
 ## 🎯 תקציר אסטרטגי (Campaign Bible)
 
-{strategy}
+""",
+            strategy,
+            "\n\n---\n\n## ✍️ פוסטים למדיה חברתית\n\n",
+            content,
+            _MD_FOOTER,
+        ]
+        md_content = "".join(parts)
 
----
-
-## ✍️ פוסטים למדיה חברתית
-
-{content}
-
----
-
-## 💡 הערות לשימוש
-
-- **העתקה מהירה:** כל פוסט מסומן בפלטפורמה שלו (LinkedIn/Facebook/Instagram)
-- **עריכה:** ניתן לערוך את הפוסטים בהתאם לצרכים ספציפיים
-- **פרסום:** כל פוסט מותאם לפורמט ולטון של הפלטפורמה שלו
-
----
-
-**🤖 נוצר על ידי Dana's Brain** - מערכת AI לייצור תוכן שיווקי
-מופעל באמצעות Chainlit + CrewAI עם RAG (Retrieval-Augmented Generation)
-"""
-
-        # Write to file with UTF-8 encoding (for Hebrew)
-        filepath.write_text(md_content, encoding='utf-8')
+        # Write to file with UTF-8 encoding (for Hebrew) - off the event
+        # loop so the disk write doesn't stall other chat sessions
+        await asyncio.to_thread(filepath.write_text, md_content, encoding='utf-8')
 
-        await cl.Message(content=f"💾 **הקובץ נשמר:** `{filepath}`").send()
+        # Caller includes the saved path in its combined success message
         return filename
 
     except Exception as e:
@@ -286,25 +366,29 @@ async def main(message: cl.Message):
     """Process user request with CrewAI (with validation and timeout)"""
     settings = cl.user_session.get("settings")
 
-    # Extract inputs
-    product = settings.get("product", "").strip()
-    benefits = settings.get("benefits", "").strip()
-    audience = settings.get("audience", "").strip()
-    offer = settings.get("offer", "").strip()
-    persona_full = settings.get("persona", "Friendly Dana - Warm conversational tone, 'best friend' voice, personal stories, casual yet expert")
+    # Extract inputs - no .strip() here; CampaignInput strips once during
+    # validation (str_strip_whitespace + not_empty_after_strip)
+    product = settings.get("product", "")
+    benefits = settings.get("benefits", "")
+    audience = settings.get("audience", "")
+    offer = settings.get("offer", "")
+    # Chainlit deserializes a fresh string per message - intern it so
+    # this and later lookups in the same process are pointer compares
+    persona_full = sys.intern(settings.get("persona", _DEFAULT_PERSONA_FULL))
 
     # Extract just the persona name (before the dash)
-    persona = persona_full.split(" - ")[0] if " - " in persona_full else persona_full
+    persona = _PERSONA_FULL_TO_NAME.get(persona_full) or persona_full.split(" - ", 1)[0]
 
-    # Validate inputs with Pydantic
+    # Validate inputs with Pydantic (model_validate on a pre-built dict
+    # skips the kwargs boxing path)
     try:
-        validated_input = CampaignInput(
-            product=product,
-            benefits=benefits,
-            audience=audience,
-            offer=offer,
-            persona=persona
-        )
+        validated_input = CampaignInput.model_validate({
+            "product": product,
+            "benefits": benefits,
+            "audience": audience,
+            "offer": offer,
+            "persona": persona
+        })
         # Use validated data
         inputs = validated_input.to_dict()
 
@@ -320,16 +404,8 @@ async def main(message: cl.Message):
                 current_value = settings.get(field, "")
                 char_count = len(current_value)
 
-                # Character limits
-                limits = {
-                    'product': 200,
-                    'benefits': 1000,
-                    'audience': 500,
-                    'offer': 300
-                }
-
                 if 'at most' in msg or 'at least' in msg:
-                    error_messages.append(f"- **{field}**: {msg}\n  → Current: {char_count} characters (Limit: {limits.get(field, '?')} chars)")
+                    error_messages.append(f"- **{field}**: {msg}\n  → Current: {char_count} characters (Limit: {_FIELD_LIMITS.get(field, '?')} chars)")
                 else:
                     error_messages.append(f"- **{field}**: {msg}")
             else:
@@ -377,11 +453,11 @@ Please check all form fields and try again.""").send()
 - חיפוש מפרטי פלטפורמה עבור כללי עיצוב
 - חיפוש ארכיטייפים עבור מבני Heart/Head/Hands
 
-אנא המתינו...""")
-    await msg.send()
+אנא המתינו...
 
-    # Send search transparency update
-    await cl.Message(content="""🔍 **פעילות חיפוש דינמית:**
+---
+
+🔍 **פעילות חיפוש דינמית:**
 
 הסוכנים מחפשים כעת באופן דינמי ב:
 - 📚 Dana_Brain_Methodology.txt (12KB - מסגרות אסטרטגיות)
@@ -390,35 +466,50 @@ Please check all form fields and try again.""").send()
 - 📚 platform_specifications.txt (6KB - מפרטי LinkedIn/FB/IG)
 - 📚 post_archetypes.txt (9KB - מסגרת Heart/Head/Hands)
 
-זהו RAG (Retrieval-Augmented Generation) בפעולה - ללא הנחיות קבועות, רק חיפושים דינמיים!""").send()
-
-    # Ensure tools initialized before agent creation
-    global TOOLS
-    if TOOLS is None:
+זהו RAG (Retrieval-Augmented Generation) בפעולה - ללא הנחיות קבועות, רק חיפושים דינמיים!""")
+    # Ensure tools initialized before agent creation (retries on failure)
+    if _ensure_tools() is None:
         await cl.Message(content="❌ הכלים לא אותחלו. אנא הפעילו מחדש את הצ'אט.").send()
         return
 
-    strategy_architect = create_strategy_architect_agent(
-        methodology_tool=TOOLS["methodology"]
+    # Start agent construction on worker threads so it overlaps with the
+    # status-message network round-trip below
+    agents_future = asyncio.gather(
+        asyncio.to_thread(
+            create_strategy_architect_agent,
+            methodology_tool=TOOLS["methodology"]
+        ),
+        asyncio.to_thread(
+            create_dana_copywriter_agent,
+            voice_tool=TOOLS["voice_examples"],
+            style_tool=TOOLS["style_guide"],
+            platform_tool=TOOLS["platform_specs"],
+            archetype_tool=TOOLS["post_archetypes"],
+            temperature=persona_temp,
+            persona=persona,
+            bulk_platform_tool=TOOLS.get("platform_specs_bulk")
+        )
     )
 
-    # Get persona-specific temperature
-    persona_temp = AgentConfig.PERSONA_TEMPERATURES.get(
-        persona,
-        AgentConfig.COPYWRITER_TEMPERATURE
-    )
+    await msg.send()
 
-    dana_copywriter = create_dana_copywriter_agent(
-        voice_tool=TOOLS["voice_examples"],
-        style_tool=TOOLS["style_guide"],
-        platform_tool=TOOLS["platform_specs"],
-        archetype_tool=TOOLS["post_archetypes"],
-        temperature=persona_temp,
-        persona=persona
-    )
+    try:
+        strategy_architect, dana_copywriter = await agents_future
+    except Exception as e:
+        await cl.Message(content=f"❌ שגיאה ביצירת הסוכנים: {str(e)}").send()
+        return
+
+    # Batch-embed the prompt-hardcoded RAG queries in one API call before
+    # the agents start issuing them one by one (no-op after first campaign)
+    await asyncio.to_thread(prewarm_embedding_cache)
 
-    # Create tasks - agents will use RAG tools to search for relevant information
-    strategy_task = create_strategy_task(strategy_architect, inputs)
+    # Create tasks - the strategy task pre-fetches its mandatory RAG
+    # context concurrently at construction time
+    strategy_task = create_strategy_task(
+        strategy_architect,
+        inputs,
+        methodology_tool=TOOLS["methodology"]
+    )
     copywriting_task = create_copywriting_task(
         dana_copywriter,
         inputs,
@@ -445,55 +536,32 @@ Please check all form fields and try again.""").send()
 
     try:
         # Run crew asynchronously with timeout (CRITICAL: wrap sync function with cl.make_async)
-        start_time = time.time()
+        start_time = time.monotonic()
 
         result = await asyncio.wait_for(
             cl.make_async(run_crew)(),
             timeout=ExecutionConfig.CREW_TIMEOUT
         )
 
-        execution_time = time.time() - start_time
+        execution_time = time.monotonic() - start_time
 
         # Extract per-task outputs for transparency
         task_outputs = getattr(result, "tasks_output", []) or []
 
-        def safe_attr(obj, names, default=""):
-            for name in names:
-                if hasattr(obj, name):
-                    val = getattr(obj, name)
-                    if val:
-                        return val
-            return default
-
         # Map task outputs by agent role for easier display
         agent_outputs = {}
         for t in task_outputs:
-            agent_name = safe_attr(t, ["agent_role", "agent_name"])
-            if not agent_name and hasattr(t, "agent") and hasattr(t.agent, "role"):
-                agent_name = t.agent.role
+            agent_name = safe_attr(t, _AGENT_NAME_ATTRS)
+            if not agent_name:
+                agent_name = safe_attr(getattr(t, "agent", None), ("role",))
             agent_name = agent_name or "Task"
 
             agent_outputs[agent_name] = {
-                "task_description": safe_attr(t, ["description", "task_description"]),
-                "output": safe_attr(t, ["output", "raw", "result", "final_answer"], default="(no output captured)")
+                "task_description": safe_attr(t, ("description", "task_description")),
+                "output": safe_attr(t, _TASK_OUTPUT_ATTRS, default="(no output captured)")
             }
 
         # Fallback: pull outputs directly from task objects if tasks_output is empty
-        def first_non_empty(*vals):
-            for v in vals:
-                if v:
-                    return v
-            return "(no output captured)"
-
-        def get_result_payload(res):
-            """Prefer the fields that contain the crew final answer."""
-            for attr in ("raw", "output", "result", "final_answer", "text"):
-                if hasattr(res, attr):
-                    val = getattr(res, attr)
-                    if val:
-                        return val
-            return None
-
         strategy_output = first_non_empty(
             agent_outputs.get(strategy_architect.role, {}).get("output"),
             getattr(strategy_task, "output", None)
@@ -542,22 +610,19 @@ Please check all form fields and try again.""").send()
 
 **⬇️ מטה תמצאו את הפרטים המלאים**""").send()
 
-        # Simplified output display with full content in MD file
-        output = f"""# 📄 תוכן מלא
+        # Push the full content in logical sections instead of one giant
+        # frame - the first section paints as soon as it's ready
+        await cl.Message(content=f"""# 📄 תוכן מלא
 
 ## ✍️ תוכן סופי - 9 פוסטים
-{final_combined_output}
+{final_combined_output}""").send()
 
----
-
-## 🎯 תקציר אסטרטגי
+        await cl.Message(content=f"""## 🎯 תקציר אסטרטגי
 {strategy_output[:500]}...
 
-*[התקציר המלא נמצא בקובץ MD]*
-
----
+*[התקציר המלא נמצא בקובץ MD]*""").send()
 
-## 📊 סיכום ביצוע
+        await cl.Message(content=f"""## 📊 סיכום ביצוע
 
 **מוצר:** {inputs['product']}
 **פרסונה:** {inputs['persona']}
@@ -592,10 +657,7 @@ Please check all form fields and try again.""").send()
 3. פרסמו בפלטפורמות הרלוונטיות
 4. **בדקו את קובץ MD השמור בתיקיית outputs/**
 
-💡 **טיפ:** שלחו הודעה נוספת עם נתונים שונים כדי לקבל עוד תוכן!"""
-
-        msg.content = output
-        await msg.update()
+💡 **טיפ:** שלחו הודעה נוספת עם נתונים שונים כדי לקבל עוד תוכן!""").send()
 
     except asyncio.TimeoutError:
         # Timeout-specific error handling
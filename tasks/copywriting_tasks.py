@@ -1,6 +1,48 @@
+from functools import lru_cache
+
 from crewai import Task, Agent
 from typing import Dict, Optional
 
+# Task description template - parsed once at import; persona is the only
+# per-call substitution
+_COPY_TASK_DESC_TMPL = """
+Write 9 Hebrew social media posts based on the Campaign Bible.
+
+**Persona:** {persona}
+
+**SEARCH ONCE at start:**
+- "Dana voice" for tone examples
+- "post archetypes" for Heart/Head/Hands structure
+
+**Fetch ALL platform specs in ONE bulk search call:**
+Use the bulk platform search tool with the JSON input
+["LinkedIn specifications", "Facebook specifications", "Instagram specifications"]
+
+**THEN write 3 posts per platform:**
+1. LinkedIn: Heart, Head, Hands posts
+2. Facebook: Heart, Head, Hands posts
+3. Instagram: Heart, Head, Hands posts
+
+**OUTPUT FORMAT (Hebrew):**
+## LINKEDIN
+### פוסט 1 (Heart) / ### פוסט 2 (Head) / ### פוסט 3 (Hands)
+## FACEBOOK
+### פוסט 1 (Heart) / ### פוסט 2 (Head) / ### פוסט 3 (Hands)
+## INSTAGRAM
+### פוסט 1 (Heart) / ### פוסט 2 (Head) / ### פוסט 3 (Hands)
+"""
+
+_COPY_TASK_EXPECTED = (
+    "9 Hebrew posts: 3 per platform (LinkedIn, Facebook, Instagram), "
+    "each with Heart/Head/Hands variants."
+)
+
+
+@lru_cache(maxsize=8)
+def _build_description(persona: str) -> str:
+    """Format the task description for a persona (only 4 legal values)."""
+    return _COPY_TASK_DESC_TMPL.format(persona=persona)
+
 
 def create_copywriting_task(
     agent: Agent,
@@ -19,29 +61,8 @@ def create_copywriting_task(
         Task configured for content creation with RAG
     """
     return Task(
-        description=f"""
-Write 9 Hebrew social media posts based on the Campaign Bible.
-
-**Persona:** {inputs['persona']}
-
-**SEARCH ONCE at start:**
-- "Dana voice" for tone examples
-- "post archetypes" for Heart/Head/Hands structure
-
-**FOR EACH PLATFORM, search its specs then write 3 posts:**
-1. LinkedIn: Search "LinkedIn specifications" → write Heart, Head, Hands posts
-2. Facebook: Search "Facebook specifications" → write Heart, Head, Hands posts
-3. Instagram: Search "Instagram specifications" → write Heart, Head, Hands posts
-
-**OUTPUT FORMAT (Hebrew):**
-## LINKEDIN
-### פוסט 1 (Heart) / ### פוסט 2 (Head) / ### פוסט 3 (Hands)
-## FACEBOOK
-### פוסט 1 (Heart) / ### פוסט 2 (Head) / ### פוסט 3 (Hands)
-## INSTAGRAM
-### פוסט 1 (Heart) / ### פוסט 2 (Head) / ### פוסט 3 (Hands)
-""",
-        expected_output="9 Hebrew posts: 3 per platform (LinkedIn, Facebook, Instagram), each with Heart/Head/Hands variants.",
+        description=_build_description(inputs['persona']),
+        expected_output=_COPY_TASK_EXPECTED,
         agent=agent,
         context=[context_task] if context_task else []
-    )
\ No newline at end of file
+    )
@@ -1,29 +1,22 @@
-from crewai import Task, Agent
-from typing import Dict
-
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-def create_strategy_task(agent: Agent, inputs: Dict[str, str]) -> Task:
-    """
-    Create a strategic analysis task using RAG searches.
-
-    Args:
-        agent: The Strategy Architect agent
-        inputs: Dictionary containing product, benefits, audience, offer, persona
+from crewai import Task, Agent
+from crewai_tools import BaseTool
+from typing import Dict, Optional
 
-    Returns:
-        Task configured for strategic analysis with RAG
-    """
-    return Task(
-        description=f"""
+# Task description template - the literal is parsed once at import and
+# format_map only fills the placeholders per call
+_STRATEGY_TASK_DESC_TMPL = """
 Create a Campaign Bible strategy document for this product:
 
-**Product:** {inputs['product']}
-**Benefits:** {inputs['benefits']}
-**Audience:** {inputs['audience']}
-**Offer:** {inputs['offer']}
-**Persona:** {inputs['persona']}
+**Product:** {product}
+**Benefits:** {benefits}
+**Audience:** {audience}
+**Offer:** {offer}
+**Persona:** {persona}
 
-**SEARCH FIRST** for Dana's methodology: "GAP Analysis", "ארכיטיפים", "פרוטוקול השקה"
+{methodology_block}
 
 **OUTPUT (Hebrew only):**
 1. GAP Analysis (מצב נוכחי vs מצב רצוי)
@@ -33,7 +26,79 @@ Create a Campaign Bible strategy document for this product:
 5. Platform Strategy Notes
 
 DO NOT write posts. Only strategic analysis for the copywriter.
-""",
-        expected_output="Campaign Bible in Hebrew: GAP analysis, audience profile, core message, archetype recommendations.",
+"""
+
+# Fallback instruction when no tool is available for pre-fetching
+_SEARCH_INSTRUCTION = (
+    '**SEARCH FIRST** for Dana\'s methodology: '
+    '"GAP Analysis", "ארכיטיפים", "פרוטוקול השקה"'
+)
+
+# The methodology searches the task mandates - fully known up front, so
+# they can run in parallel at construction time instead of serially
+# inside the agent's reasoning loop
+_STRATEGY_PREFETCH_QUERIES = ("GAP Analysis", "ארכיטיפים", "פרוטוקול השקה")
+
+_STRATEGY_TASK_EXPECTED = (
+    "Campaign Bible in Hebrew: GAP analysis, audience profile, "
+    "core message, archetype recommendations."
+)
+
+
+@lru_cache(maxsize=4096)
+def _build_description(frozen_inputs: frozenset, methodology_block: str) -> str:
+    """
+    Format the task description, memoized on the campaign inputs.
+
+    Under kickoff_for_each-style batch runs many campaigns share the
+    same inputs; only the formatting is cached here - Task objects are
+    built fresh per call because CrewAI mutates them during execution.
+    """
+    return _STRATEGY_TASK_DESC_TMPL.format_map(
+        {**dict(frozen_inputs), 'methodology_block': methodology_block}
+    )
+
+
+def _prefetch_methodology_context(methodology_tool: BaseTool) -> str:
+    """Run the mandatory methodology searches concurrently and join them."""
+    with ThreadPoolExecutor(max_workers=len(_STRATEGY_PREFETCH_QUERIES)) as ex:
+        results = list(ex.map(methodology_tool._run, _STRATEGY_PREFETCH_QUERIES))
+    return "\n---\n".join(results)
+
+
+def create_strategy_task(
+    agent: Agent,
+    inputs: Dict[str, str],
+    methodology_tool: Optional[BaseTool] = None
+) -> Task:
+    """
+    Create a strategic analysis task.
+
+    When a methodology tool is provided, the mandatory RAG searches run
+    concurrently here and their results are inlined into the prompt, so
+    the agent starts writing immediately instead of issuing serial tool
+    calls. Without a tool, the prompt falls back to instructing the
+    agent to search.
+
+    Args:
+        agent: The Strategy Architect agent
+        inputs: Dictionary containing product, benefits, audience, offer, persona
+        methodology_tool: Optional methodology search tool for pre-fetching
+
+    Returns:
+        Task configured for strategic analysis
+    """
+    if methodology_tool is not None:
+        methodology_block = (
+            "**Pre-fetched Methodology Context (already searched - "
+            "do NOT search again):**\n"
+            + _prefetch_methodology_context(methodology_tool)
+        )
+    else:
+        methodology_block = _SEARCH_INSTRUCTION
+
+    return Task(
+        description=_build_description(frozenset(inputs.items()), methodology_block),
+        expected_output=_STRATEGY_TASK_EXPECTED,
         agent=agent
-    )
\ No newline at end of file
+    )
@@ -4,6 +4,8 @@ Test script for Phase 1 critical fixes
 
 import sys
 import asyncio
+import functools
+import inspect
 import io
 from pydantic import ValidationError
 
@@ -11,6 +13,12 @@ from pydantic import ValidationError
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
+
+@functools.lru_cache(maxsize=None)
+def _sig(fn):
+    """Memoized inspect.signature - each call re-walks wrapper chains."""
+    return inspect.signature(fn)
+
 print("=" * 60)
 print("PHASE 1 CRITICAL FIXES - TEST SUITE")
 print("=" * 60)
@@ -104,12 +112,11 @@ try:
     print("[OK] All agent modules imported")
     print("[OK] All task modules imported")
 
-    # Check function signatures
-    import inspect
-    sig = inspect.signature(create_strategy_architect_agent)
+    # Check function signatures (memoized - see _sig above)
+    sig = _sig(create_strategy_architect_agent)
     print(f"  Strategy architect signature: {sig}")
 
-    sig = inspect.signature(create_dana_copywriter_agent)
+    sig = _sig(create_dana_copywriter_agent)
     print(f"  Dana copywriter signature: {sig}")
 
     print("[OK] Type hints test PASSED")
@@ -136,36 +143,36 @@ except Exception as e:
     print(f"[FAIL] File validation test FAILED: {e}")
     sys.exit(1)
 
-# Test 7: Thread Lock Presence
-print("\n[Test 7] Thread Safety Implementation")
+# Test 7: Startup Safety (eager tool init + execution timeout)
+print("\n[Test 7] Startup Safety Implementation")
 print("-" * 40)
 try:
-    import threading
+    import re
 
-    # Check if TOOLS_LOCK exists in start.py
     with open('start.py', 'r', encoding='utf-8') as f:
         content = f.read()
-        if 'TOOLS_LOCK = threading.Lock()' in content:
-            print("[OK] Thread lock found in start.py")
-        else:
-            print("[FAIL] Thread lock NOT found in start.py")
-            sys.exit(1)
 
-        if 'with TOOLS_LOCK:' in content:
-            print("[OK] Thread lock usage found")
-        else:
-            print("[FAIL] Thread lock usage NOT found")
-            sys.exit(1)
+    required_texts = [
+        'DANA_SKIP_EAGER_INIT',   # eager init-at-import with escape hatch
+        'TOOLS_INIT_ERROR',       # import-time failures surfaced per chat
+        'asyncio.wait_for',       # execution timeout
+    ]
+
+    # One compiled alternation scans the file once instead of a substring
+    # search per sentinel
+    pattern = re.compile('|'.join(map(re.escape, required_texts)))
+    found = set(pattern.findall(content))
 
-        if 'asyncio.wait_for' in content:
-            print("[OK] Execution timeout found (asyncio.wait_for)")
+    for text in required_texts:
+        if text in found:
+            print(f"[OK] Found: '{text}'")
         else:
-            print("[FAIL] Execution timeout NOT found")
+            print(f"[FAIL] Missing: '{text}'")
             sys.exit(1)
 
-    print("[OK] Thread safety test PASSED")
+    print("[OK] Startup safety test PASSED")
 except Exception as e:
-    print(f"[FAIL] Thread safety test FAILED: {e}")
+    print(f"[FAIL] Startup safety test FAILED: {e}")
     sys.exit(1)
 
 # Test 8: Configuration Helper Functions
@@ -195,7 +202,7 @@ print("=" * 60)
 print("\nPhase 1 Critical Fixes Status:")
 print("[OK] Configuration Management - WORKING")
 print("[OK] Pydantic Input Validation - WORKING")
-print("[OK] Thread Safety Implementation - WORKING")
+print("[OK] Startup Safety Implementation - WORKING")
 print("[OK] Execution Timeout - WORKING")
 print("[OK] Type Hints - WORKING")
 print("[OK] Error Handling - WORKING")
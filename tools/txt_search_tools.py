@@ -20,12 +20,14 @@ from tools.chromadb_search_tool import (
     create_style_guide_search_tool,
     create_platform_specs_search_tool,
     create_post_archetypes_search_tool,
+    create_bulk_platform_specs_search_tool,
     # Use centralized RAG logging from chromadb_search_tool
     get_chromadb_query_log,
-    clear_chromadb_query_log
+    clear_chromadb_query_log,
+    prewarm_embedding_cache
 )
 
-from config import DataFiles
+from config import DataFiles, CHROMADB_DIR
 from models import ToolInitError
 
 
@@ -60,17 +62,57 @@ def create_post_archetypes_tool() -> BaseTool:
     return create_post_archetypes_search_tool()
 
 
+def create_bulk_platform_specs_tool() -> BaseTool:
+    """Tool for Dana Copywriter to search all platform specs in one batched call"""
+    return create_bulk_platform_specs_search_tool()
+
+
+class LazyToolDict:
+    """
+    Dict-like tool container that builds each tool on first access.
+
+    Only the methodology tool (used by the Strategy Architect's first
+    step) is created eagerly at startup; the other collections stay on
+    disk until an agent actually calls them, keeping resident memory low
+    on Streamlit Cloud. Built tools are memoized.
+    """
+
+    def __init__(self, factories: Dict[str, object]):
+        self._factories = factories
+        self._tools: Dict[str, BaseTool] = {}
+
+    def __getitem__(self, key: str) -> BaseTool:
+        if key not in self._tools:
+            self._tools[key] = self._factories[key]()
+        return self._tools[key]
+
+    def get(self, key: str, default=None):
+        if key not in self._factories:
+            return default
+        return self[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._factories
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+    def keys(self):
+        return self._factories.keys()
+
+
 @st.cache_resource
-def initialize_all_tools() -> Dict[str, BaseTool]:
+def initialize_all_tools() -> LazyToolDict:
     """
-    Initialize all tools at startup with proper error handling.
+    Initialize the tool container at startup with proper error handling.
     Uses pre-built ChromaDB - NO embedding regeneration!
 
     Cached with @st.cache_resource to ensure tools are created once
-    and reused across all sessions and page navigations.
+    and reused across all sessions and page navigations. Only the
+    methodology tool is built eagerly; the rest load on first use.
 
     Returns:
-        Dictionary of initialized ChromaDBSearchTool instances
+        LazyToolDict of ChromaDBSearchTool factories
 
     Raises:
         RuntimeError: If ChromaDB collections don't exist
@@ -88,14 +130,33 @@ def initialize_all_tools() -> Dict[str, BaseTool]:
         )
         raise FileNotFoundError(error.format_for_user())
 
-    # Initialize tools with specific error handling
-    tools = {}
+    # Guard against a missing pre-built store before touching any
+    # collection: get_collection would fail anyway, but with a less
+    # actionable message - and nothing here should ever fall back to
+    # re-embedding the corpus at startup
+    if not (CHROMADB_DIR / "chroma.sqlite3").exists():
+        error = ToolInitError(
+            error_type="Empty ChromaDB Store",
+            message=f"No pre-built collections found in {CHROMADB_DIR}",
+            missing_files=None,
+            suggestion="Restore the committed .chromadb/ directory (or run the one-time embedding build); do not rebuild embeddings at app startup"
+        )
+        raise RuntimeError(error.format_for_user())
+
+    tools = LazyToolDict({
+        "methodology": create_methodology_tool,
+        "voice_examples": create_voice_examples_tool,
+        "style_guide": create_style_guide_tool,
+        "platform_specs": create_platform_specs_tool,
+        "post_archetypes": create_post_archetypes_tool,
+        "platform_specs_bulk": create_bulk_platform_specs_tool,
+    })
+
+    # Build only the methodology tool eagerly (with specific error
+    # handling) - it is the first one any crew touches, and its creation
+    # exercises the client, collection access and embedding prewarm
     try:
-        tools["methodology"] = create_methodology_tool()
-        tools["voice_examples"] = create_voice_examples_tool()
-        tools["style_guide"] = create_style_guide_tool()
-        tools["platform_specs"] = create_platform_specs_tool()
-        tools["post_archetypes"] = create_post_archetypes_tool()
+        tools["methodology"]
 
     except FileNotFoundError as e:
         # Specific file missing
@@ -130,7 +191,12 @@ def initialize_all_tools() -> Dict[str, BaseTool]:
         )
         raise RuntimeError(error.format_for_user())
 
-    print("✅ All ChromaDB tools loaded successfully (using pre-built embeddings)!")
+    # Warm the embedding cache with the prompt-hardcoded queries before
+    # the UI accepts input (no-op if the factory already triggered it).
+    # Runs inside @st.cache_resource, so once per container.
+    prewarm_embedding_cache()
+
+    print("✅ ChromaDB tools ready (methodology loaded, others lazy)!")
     return tools
 
 
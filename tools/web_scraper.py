@@ -4,21 +4,247 @@ Dana's Brain - Web Scraper Tool
 Scrapes product information from websites and extracts structured data using LLM
 """
 
+import asyncio
+import hashlib
 import re
 import json
-from typing import Dict, Any
-from bs4 import BeautifulSoup
+import sqlite3
+import time
+from functools import lru_cache
+from typing import Dict, Any, List
+import lxml.etree
+import lxml.html
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from openai import OpenAI
 
 from models import WebScrapingInput, WebScrapingResult
-from config import OPENAI_API_KEY
+from config import OPENAI_API_KEY, CHROMADB_DIR
 
 
 # Language detection patterns
 HEBREW_PATTERN = re.compile(r'[\u0590-\u05FF]')
 FRENCH_PATTERN = re.compile(r'[àâäæçéèêëïîôœùûüÿ]', re.IGNORECASE)
 
+# Shared HTTP session: keep-alive and connection pooling skip the DNS
+# lookup and TLS handshake on repeated hits to the same host, and the
+# retry policy absorbs transient failures that used to surface directly
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'he,en-US;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+})
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+)
+_SESSION.mount('https://', _adapter)
+_SESSION.mount('http://', _adapter)
+
+# Hard cap on bytes read per page - the product/offer signal lives in
+# the first chunk, never megabytes in
+_MAX_DOWNLOAD_BYTES = 2_000_000
+
+# Persistent scrape-result cache (same pattern as the embedding cache):
+# a resubmitted URL skips both the HTTP fetch and the LLM call. Only
+# confident successes are stored, so transient network failures and
+# thin extractions are always retried.
+_SCRAPE_CACHE_DB = CHROMADB_DIR / "scrape_cache.sqlite3"
+_SCRAPE_CACHE_TTL_S = 24 * 3600
+_SCRAPE_CACHE_MIN_CONFIDENCE = 0.5
+
+_scrape_cache_conn = sqlite3.connect(str(_SCRAPE_CACHE_DB), check_same_thread=False)
+_scrape_cache_conn.execute("PRAGMA journal_mode=WAL")
+_scrape_cache_conn.execute("PRAGMA synchronous=NORMAL")
+_scrape_cache_conn.execute(
+    "CREATE TABLE IF NOT EXISTS scrape(k BLOB PRIMARY KEY, v TEXT, ts REAL)"
+)
+# Second tier keyed by page *content*: two URLs serving the same product
+# page (mirrors, tracking-parameter variants) share one LLM extraction
+_scrape_cache_conn.execute(
+    "CREATE TABLE IF NOT EXISTS extract(k BLOB PRIMARY KEY, v TEXT, ts REAL)"
+)
+_scrape_cache_conn.execute(
+    "DELETE FROM scrape WHERE ts < ?", (time.time() - _SCRAPE_CACHE_TTL_S,)
+)
+_scrape_cache_conn.execute(
+    "DELETE FROM extract WHERE ts < ?", (time.time() - _SCRAPE_CACHE_TTL_S,)
+)
+_scrape_cache_conn.commit()
+
+_scrape_cache_hits = 0
+_scrape_cache_misses = 0
+
+
+def _scrape_cache_key(clean_url: str) -> bytes:
+    """Stable on-disk cache key for a normalized URL (versioned so a
+    format change never deserializes stale rows)."""
+    return hashlib.sha256(f"{clean_url}|v1".encode()).digest()
+
+
+def _content_cache_key(clean_text: str, detected_language: str) -> bytes:
+    """Cache key for an extraction, hashed over the leading content slice
+    (enough to distinguish pages) plus the detected language."""
+    return hashlib.sha256(
+        f"{detected_language}|{clean_text[:2000]}|v1".encode()
+    ).digest()
+
+
+def clear_scrape_cache():
+    """Drop all cached scrape results (e.g. after a landing page changes)."""
+    global _scrape_cache_hits, _scrape_cache_misses
+    _scrape_cache_conn.execute("DELETE FROM scrape")
+    _scrape_cache_conn.execute("DELETE FROM extract")
+    _scrape_cache_conn.commit()
+    _scrape_cache_hits = 0
+    _scrape_cache_misses = 0
+
+
+def get_scrape_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters and row count for the scrape-result cache."""
+    rows = _scrape_cache_conn.execute("SELECT COUNT(*) FROM scrape").fetchone()[0]
+    return {
+        'rows': rows,
+        'hits': _scrape_cache_hits,
+        'misses': _scrape_cache_misses,
+    }
+
+
+# Character budget for the content slice sent to the LLM. The full
+# clean_text (up to 8000 chars) is mostly boilerplate; the extraction
+# needs the product/offer signal, and input tokens are paid per call
+MAX_LLM_CHARS = 3500
+
+# Price/offer signals used to rank paragraphs into the LLM slice
+_OFFER_SIGNAL_RE = re.compile(
+    r'[₪$%€]|הנחה|מבצע|חינם|discount|free|trial|offer|sale',
+    re.IGNORECASE
+)
+
+
+def _slice_for_llm(raw_text: str, collapsed: str) -> str:
+    """
+    Fit the page text into MAX_LLM_CHARS, preferring paragraphs that
+    carry price/offer signal.
+
+    Paragraphs are scored with one regex pass, taken greedily into the
+    budget, then re-joined in document order so the slice still reads
+    coherently. Falls back to a plain head slice when the page has no
+    paragraph structure.
+    """
+    if len(collapsed) <= MAX_LLM_CHARS:
+        return collapsed
+
+    paragraphs = [' '.join(p.split()) for p in raw_text.split('\n')]
+    paragraphs = [p for p in paragraphs if p]
+
+    # Offer-bearing paragraphs first; document order breaks ties
+    ranked = sorted(
+        range(len(paragraphs)),
+        key=lambda i: (0 if _OFFER_SIGNAL_RE.search(paragraphs[i]) else 1, i)
+    )
+
+    chosen = []
+    budget = MAX_LLM_CHARS
+    for i in ranked:
+        cost = len(paragraphs[i]) + 1
+        if cost > budget:
+            continue
+        chosen.append(i)
+        budget -= cost
+
+    if not chosen:
+        return collapsed[:MAX_LLM_CHARS]
+
+    return ' '.join(paragraphs[i] for i in sorted(chosen))
+
+
+# Junk-page gate: pages that obviously hold no campaign signal skip the
+# LLM call entirely. One precompiled alternation over the page head and
+# title; a catch-all title regex for placeholder pages
+_MIN_CONTENT_CHARS = 300
+# Error phrases decisive on their own; "404" is too common in phone
+# numbers, addresses and SKUs, so it only counts as junk when the page
+# is also suspiciously thin (see _JUNK_404_MAX_CHARS)
+_JUNK_PHRASE_RE = re.compile(
+    r'page not found|access denied|sign in to continue|'
+    r'העמוד לא נמצא|דף לא נמצא|הגישה נדחתה',
+    re.IGNORECASE
+)
+_JUNK_404_RE = re.compile(r'\b404\b')
+_JUNK_404_MAX_CHARS = 1500
+
+
+def _is_junk_page(scraped_data: Dict[str, Any]) -> bool:
+    """True for error/parking/login pages that would only waste an LLM call."""
+    title = scraped_data.get('title', '').strip()
+    head = scraped_data['clean_text'][:500]
+    if _JUNK_PHRASE_RE.search(head) or _JUNK_PHRASE_RE.search(title):
+        return True
+    # A bare "404" needs corroboration: real error pages are short,
+    # while a product page may carry 404 in a street address or SKU
+    if len(scraped_data['clean_text']) < _JUNK_404_MAX_CHARS:
+        return bool(_JUNK_404_RE.search(head) or _JUNK_404_RE.search(title))
+    return False
+
+
+# Fully static extraction-prompt preamble. Every call sends this block
+# byte-identical, with the per-URL content appended at the very end -
+# the order OpenAI's prefix cache needs to hit (it hashes the leading
+# tokens of the prompt)
+_EXTRACTION_PROMPT_PREFIX = """You are a marketing data extraction assistant. Extract structured campaign information from the website content at the end of this message and translate everything to Hebrew.
+
+**Task:** Extract the following fields in JSON format and TRANSLATE all content to HEBREW. If a field cannot be found, use null.
+
+**Output Format:**
+{
+    "product": "Product or service name IN HEBREW",
+    "benefits": "Key benefits and features IN HEBREW (detailed, 50-200 words)",
+    "audience": "Target audience description IN HEBREW (20-100 words)",
+    "offer": "Current promotional offer, discount, or call-to-action IN HEBREW"
+}
+
+**CRITICAL INSTRUCTIONS:**
+1. The language of the website content is stated on the "Content language" line below (he = Hebrew, en = English, fr = French)
+2. **TRANSLATE EVERYTHING TO HEBREW** - all extracted fields must be in Hebrew (עברית)
+3. For benefits: combine multiple benefits into a comprehensive paragraph IN HEBREW
+4. For audience: infer from content if not explicitly stated, write IN HEBREW
+5. For offer: look for promotions, discounts, special deals, CTAs and translate to HEBREW
+6. If you cannot find a field, set it to null (not empty string)
+7. Product names can stay in original language if they are brand names, but add Hebrew description
+
+**Output only valid JSON with all content in Hebrew, no additional text.**
+
+"""
+
+# Per-language prompt heads, assembled once at import. Everything up to
+# the content tail is byte-identical across calls in the same language,
+# which is exactly the stability the prefix cache needs
+_PROMPT_HEADS = {
+    lang: _EXTRACTION_PROMPT_PREFIX + f"Content language: {lang}\n\n---\nCONTENT:\n\n"
+    for lang in ('he', 'en', 'fr')
+}
+
+# The only per-call string work: one format over the three scraped fields
+_PROMPT_CONTENT_TAIL = (
+    "**Website Title:** {title}\n\n"
+    "**Meta Description:** {meta}\n\n"
+    "**Website Content:**\n{content}\n"
+)
+
+
+@lru_cache(maxsize=1)
+def _get_openai_client() -> OpenAI:
+    """Shared OpenAI client - the constructor builds an httpx.Client and
+    transport middleware, and reusing one instance keeps the TLS
+    connection to the API warm across extractions. Timeout and retries
+    live on the client instead of every create() call."""
+    return OpenAI(api_key=OPENAI_API_KEY, timeout=30.0, max_retries=2)
+
 
 def detect_language(text: str) -> str:
     """
@@ -30,8 +256,16 @@ def detect_language(text: str) -> str:
     Returns:
         Language code: 'he' (Hebrew), 'fr' (French), or 'en' (English)
     """
-    hebrew_count = len(HEBREW_PATTERN.findall(text))
-    french_count = len(FRENCH_PATTERN.findall(text))
+    # Count matches without materializing a list of one-char strings
+    # (findall allocates O(n) matches just to take their length)
+    hebrew_count = sum(1 for _ in HEBREW_PATTERN.finditer(text))
+    french_count = sum(1 for _ in FRENCH_PATTERN.finditer(text))
+
+    # Absolute count first: a Hebrew product page padded with long
+    # English brand names can dilute the ratio below the threshold, but
+    # dozens of Hebrew characters are decisive on their own
+    if hebrew_count >= 20:
+        return 'he'
 
     if len(text) > 0 and (hebrew_count / len(text)) > 0.05:
         return 'he'
@@ -61,38 +295,42 @@ def scrape_website(url: str, timeout: int = 10) -> Dict[str, Any]:
     validated_input = WebScrapingInput(url=url)
     clean_url = validated_input.url
 
-    # Set headers
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'he,en-US;q=0.9,en;q=0.8',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive',
-    }
-
-    # Make request
-    response = requests.get(clean_url, headers=headers, timeout=timeout, allow_redirects=True)
+    # Make request on the shared keep-alive session; stream so the body
+    # is only read after the headers pass the guards below
+    response = _SESSION.get(clean_url, timeout=timeout, allow_redirects=True, stream=True)
     response.raise_for_status()
 
-    # Parse HTML
-    soup = BeautifulSoup(response.content, 'lxml')
-
-    # Remove unwanted elements
-    for script in soup(['script', 'style', 'nav', 'footer', 'header']):
-        script.decompose()
+    # Pre-flight guard: refuse PDFs/images/downloads before parsing, and
+    # cap the read so a pathological page can't buffer tens of MB - the
+    # useful content of a landing page is always in the first chunk
+    content_type = response.headers.get('Content-Type', '')
+    if not content_type.startswith(('text/html', 'application/xhtml')):
+        raise ValueError(f"הכתובת אינה דף HTML (Content-Type: {content_type or 'unknown'})")
+
+    content = response.raw.read(_MAX_DOWNLOAD_BYTES, decode_content=True)
+
+    # Parse HTML with lxml directly - BeautifulSoup layered Python-level
+    # tree walks on top of the same lxml parse for the three fields
+    # this function actually needs
+    tree = lxml.html.fromstring(content)
+
+    # Remove unwanted elements in a single C-level traversal; noscript,
+    # iframe and svg are common and never hold product text
+    lxml.etree.strip_elements(
+        tree, 'script', 'style', 'nav', 'footer', 'header',
+        'noscript', 'iframe', 'svg', with_tail=False
+    )
 
     # Extract title
-    title = soup.title.string if soup.title else ""
+    title = tree.findtext('.//title') or ""
 
     # Extract meta description
-    meta_desc = ""
-    meta_tag = soup.find('meta', attrs={'name': 'description'})
-    if meta_tag and meta_tag.get('content'):
-        meta_desc = meta_tag['content']
+    meta_desc = tree.xpath('string(//meta[@name="description"]/@content)') or ""
 
-    # Extract clean text
-    text = soup.get_text(separator=' ', strip=True)
-    text = re.sub(r'\s+', ' ', text).strip()
+    # Extract clean text; split/join collapses whitespace runs in one
+    # C-level pass instead of a regex scan plus a strip pass
+    raw_text = tree.text_content()
+    text = ' '.join(raw_text.split())
 
     # Limit text length to avoid token limits
     if len(text) > 8000:
@@ -100,6 +338,7 @@ def scrape_website(url: str, timeout: int = 10) -> Dict[str, Any]:
 
     return {
         'clean_text': text,
+        'llm_text': _slice_for_llm(raw_text, text),
         'title': title.strip() if title else "",
         'meta_description': meta_desc.strip()
     }
@@ -119,48 +358,29 @@ def extract_campaign_data_with_llm(
     Returns:
         Dict with product, benefits, audience, offer fields
     """
-    client = OpenAI(api_key=OPENAI_API_KEY)
-
-    language_note = {
-        'he': 'The content is in Hebrew',
-        'en': 'The content is in English',
-        'fr': 'The content is in French'
-    }
-
-    prompt = f"""You are a marketing data extraction assistant. Extract structured campaign information from the following website content and translate everything to Hebrew.
-
-**Website Title:** {scraped_data.get('title', 'N/A')}
-
-**Meta Description:** {scraped_data.get('meta_description', 'N/A')}
-
-**Website Content:**
-{scraped_data['clean_text']}
-
----
-
-**Task:** Extract the following fields in JSON format and TRANSLATE all content to HEBREW. If a field cannot be found, use null.
-
-**Output Format:**
-{{
-    "product": "Product or service name IN HEBREW",
-    "benefits": "Key benefits and features IN HEBREW (detailed, 50-200 words)",
-    "audience": "Target audience description IN HEBREW (20-100 words)",
-    "offer": "Current promotional offer, discount, or call-to-action IN HEBREW"
-}}
-
-**CRITICAL INSTRUCTIONS:**
-1. The website content is in {language_note.get(detected_language, 'the original language')}
-2. **TRANSLATE EVERYTHING TO HEBREW** - all extracted fields must be in Hebrew (עברית)
-3. For benefits: combine multiple benefits into a comprehensive paragraph IN HEBREW
-4. For audience: infer from content if not explicitly stated, write IN HEBREW
-5. For offer: look for promotions, discounts, special deals, CTAs and translate to HEBREW
-6. If you cannot find a field, set it to null (not empty string)
-7. Product names can stay in original language if they are brand names, but add Hebrew description
-
-**Output only valid JSON with all content in Hebrew, no additional text:**
-"""
+    # Content-keyed cache: mirror sites and tracking-parameter URL
+    # variants produce identical clean_text, so the extraction is reused
+    # even when the URL-level cache misses
+    content_key = _content_cache_key(scraped_data['clean_text'], detected_language)
+    row = _scrape_cache_conn.execute(
+        "SELECT v, ts FROM extract WHERE k = ?", (content_key,)
+    ).fetchone()
+    if row is not None and time.time() - row[1] < _SCRAPE_CACHE_TTL_S:
+        return json.loads(row[0])
+
+    client = _get_openai_client()
+
+    # Static head first, variable content last: OpenAI's automatic
+    # prefix cache hashes the start of the prompt, so every call in the
+    # same language shares its precomputed head byte-for-byte
+    head = _PROMPT_HEADS.get(detected_language, _PROMPT_HEADS['en'])
+    prompt = head + _PROMPT_CONTENT_TAIL.format(
+        title=scraped_data.get('title') or 'N/A',
+        meta=scraped_data.get('meta_description') or 'N/A',
+        content=scraped_data.get('llm_text') or scraped_data['clean_text'],
+    )
 
-    # Call OpenAI with timeout to prevent hanging
+    # Call OpenAI (timeout and retries are configured on the shared client)
     response = client.chat.completions.create(
         model="gpt-4o-mini",
         messages=[
@@ -168,28 +388,61 @@ def extract_campaign_data_with_llm(
             {"role": "user", "content": prompt}
         ],
         temperature=0.3,
-        max_tokens=1000,
-        timeout=30.0  # 30 second timeout to prevent indefinite hangs
+        # JSON mode: the model cannot emit markdown fences or prose, so
+        # the fence-stripping branch below is a dormant safety net
+        response_format={"type": "json_object"},
+        # The prompt asks for 50-200 words of benefits plus 20-100 of
+        # audience, and Hebrew runs 2+ tokens per word - a compliant
+        # response needs the full budget
+        max_tokens=1000
     )
 
+    # A capped response is truncated mid-object in JSON mode; parsing it
+    # would just fail noisily, so treat it as the empty-extraction case
+    if response.choices[0].finish_reason == "length":
+        return {
+            'product': None,
+            'benefits': None,
+            'audience': None,
+            'offer': None
+        }
+
     # Parse JSON response
     try:
         result_text = response.choices[0].message.content.strip()
 
-        # Remove markdown code fences if present
+        # Remove markdown code fences if present (pure string ops - no
+        # regex engine, and immune to re's internal cache eviction).
+        # JSON mode makes this a dormant safety net.
         if result_text.startswith('```'):
-            result_text = re.sub(r'^```json?\s*', '', result_text)
-            result_text = re.sub(r'\s*```$', '', result_text)
+            result_text = (
+                result_text
+                .removeprefix('```json')
+                .removeprefix('```')
+                .removesuffix('```')
+                .strip()
+            )
 
         extracted_data = json.loads(result_text)
 
-        return {
+        extracted = {
             'product': extracted_data.get('product'),
             'benefits': extracted_data.get('benefits'),
             'audience': extracted_data.get('audience'),
             'offer': extracted_data.get('offer')
         }
 
+        # Cache extractions that found at least one field; all-null
+        # results are cheap to recompute and may be transient
+        if any(extracted.values()):
+            _scrape_cache_conn.execute(
+                "INSERT OR REPLACE INTO extract(k, v, ts) VALUES (?, ?, ?)",
+                (content_key, json.dumps(extracted, ensure_ascii=False), time.time())
+            )
+            _scrape_cache_conn.commit()
+
+        return extracted
+
     except json.JSONDecodeError:
         # Fallback: return empty data
         return {
@@ -210,7 +463,21 @@ def scrape_and_extract(url: str) -> WebScrapingResult:
     Returns:
         WebScrapingResult with extracted data or error
     """
+    global _scrape_cache_hits, _scrape_cache_misses
+
     try:
+        # Step 0: Check the result cache (keyed by the normalized URL,
+        # so "example.com" and "https://example.com" share an entry)
+        clean_url = WebScrapingInput(url=url).url
+        cache_key = _scrape_cache_key(clean_url)
+        row = _scrape_cache_conn.execute(
+            "SELECT v, ts FROM scrape WHERE k = ?", (cache_key,)
+        ).fetchone()
+        if row is not None and time.time() - row[1] < _SCRAPE_CACHE_TTL_S:
+            _scrape_cache_hits += 1
+            return WebScrapingResult.model_validate_json(row[0])
+        _scrape_cache_misses += 1
+
         # Step 1: Scrape website
         scraped_data = scrape_website(url)
 
@@ -218,6 +485,18 @@ def scrape_and_extract(url: str) -> WebScrapingResult:
         combined_text = f"{scraped_data['title']} {scraped_data['meta_description']} {scraped_data['clean_text'][:500]}"
         detected_lang = detect_language(combined_text)
 
+        # Step 2.5: Don't default to the LLM - pages with no real
+        # content (404s, login walls, parking pages) get a canned
+        # failure instead of a pointless paid call
+        if (len(scraped_data['clean_text']) < _MIN_CONTENT_CHARS
+                or _is_junk_page(scraped_data)):
+            return WebScrapingResult(
+                success=False,
+                url=url,
+                detected_language=detected_lang,
+                error_message="דף ללא תוכן מספק"
+            )
+
         # Step 3: Extract with LLM
         extracted = extract_campaign_data_with_llm(scraped_data, detected_lang)
 
@@ -226,7 +505,7 @@ def scrape_and_extract(url: str) -> WebScrapingResult:
         confidence = filled_fields / 4.0
 
         # Step 5: Build result
-        return WebScrapingResult(
+        result = WebScrapingResult(
             success=True,
             url=url,
             product=extracted['product'],
@@ -238,6 +517,17 @@ def scrape_and_extract(url: str) -> WebScrapingResult:
             error_message=None
         )
 
+        # Step 6: Cache confident successes so a resubmitted URL is a
+        # disk read instead of a fetch + LLM round-trip
+        if confidence > _SCRAPE_CACHE_MIN_CONFIDENCE:
+            _scrape_cache_conn.execute(
+                "INSERT OR REPLACE INTO scrape(k, v, ts) VALUES (?, ?, ?)",
+                (cache_key, result.model_dump_json(), time.time())
+            )
+            _scrape_cache_conn.commit()
+
+        return result
+
     except requests.RequestException as e:
         return WebScrapingResult(
             success=False,
@@ -258,3 +548,38 @@ def scrape_and_extract(url: str) -> WebScrapingResult:
             url=url,
             error_message=f"שגיאה לא צפויה: {str(e)}"
         )
+
+
+async def scrape_and_extract_async(url: str) -> WebScrapingResult:
+    """Async wrapper: runs the blocking fetch+LLM pipeline off the event loop.
+
+    Goes through scrape_and_extract in a worker thread so the URL and
+    content caches, the shared session pool and the error handling are
+    all reused on the async path.
+    """
+    return await asyncio.to_thread(scrape_and_extract, url)
+
+
+async def scrape_many(urls: List[str], concurrency: int = 10) -> List[WebScrapingResult]:
+    """
+    Scrape several URLs concurrently.
+
+    Each pipeline is an independent fetch + LLM round-trip, so running
+    them under a semaphore makes wall time ~= the slowest batch slice
+    instead of the sum. scrape_and_extract never raises (errors come
+    back as failed results), so gather needs no exception handling.
+
+    Args:
+        urls: URLs to scrape
+        concurrency: Maximum pipelines in flight at once
+
+    Returns:
+        WebScrapingResults aligned with the input order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded(u: str) -> WebScrapingResult:
+        async with semaphore:
+            return await scrape_and_extract_async(u)
+
+    return list(await asyncio.gather(*(_bounded(u) for u in urls)))
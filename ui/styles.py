@@ -4,14 +4,21 @@ Dana's Brain - Custom CSS Styles
 Purple/Magenta dark theme with Hebrew RTL support
 """
 
+import hashlib
+import re
+from pathlib import Path
+
 import streamlit as st
 
+# App-root static/ directory, served at app/static/* when
+# server.enableStaticServing is on
+_STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+_CSS_FILENAME = "dana.css"
+
 
-@st.cache_data(show_spinner=False)
-def _get_css_content():
-    """Get CSS content (cached to avoid re-rendering)."""
-    return """
-    <style>
+# Raw stylesheet in readable form; what ships is the minified _CSS
+# constant built once at import below
+_RAW_CSS = """
     /* ====================
        GLOBAL STYLES
        ==================== */
@@ -545,16 +552,54 @@ def _get_css_content():
     .p-1 { padding: 10px; }
     .p-2 { padding: 20px; }
     .p-3 { padding: 30px; }
+    """
+
+
+def _minify(css: str) -> str:
+    """Strip comments, collapse whitespace and drop spaces around CSS
+    punctuation - ~2.5x smaller payload, identical rendering."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{}:;,>])\s*', r'\1', css)
+    return css.strip()
+
+
+# Minified once at import; a module constant needs no cache decorator
+_CSS = _minify(_RAW_CSS)
 
-    </style>
+
+@st.cache_resource(show_spinner=False)
+def _static_css_href():
+    """Write the CSS to static/dana.css once per process and return its
+    href (content-hashed for cache busting), or None when the static
+    directory is not writable - callers then fall back to inline CSS.
+
+    With server.enableStaticServing on, the browser fetches the sheet
+    once and caches it, so each rerun ships a ~100-byte link tag over
+    the websocket instead of the whole blob.
     """
-    return css_content
+    css = _CSS
+    try:
+        _STATIC_DIR.mkdir(exist_ok=True)
+        target = _STATIC_DIR / _CSS_FILENAME
+        if not target.exists() or target.read_text(encoding="utf-8") != css:
+            target.write_text(css, encoding="utf-8")
+        digest = hashlib.sha1(css.encode()).hexdigest()[:8]
+        return f"app/static/{_CSS_FILENAME}?v={digest}"
+    except OSError:
+        return None
 
 
 def load_custom_css():
     """Load custom CSS for purple/magenta theme and RTL support (cached for performance)."""
-    css_content = _get_css_content()
-    st.markdown(css_content, unsafe_allow_html=True)
+    href = _static_css_href()
+    if href:
+        st.markdown(
+            f'<link rel="stylesheet" href="{href}">',
+            unsafe_allow_html=True
+        )
+    else:
+        st.markdown(f"<style>{_CSS}</style>", unsafe_allow_html=True)
 
 
 def rtl_text(text: str, tag="p", class_name="rtl-text"):
@@ -572,6 +617,32 @@ def rtl_text(text: str, tag="p", class_name="rtl-text"):
     )
 
 
+def _metric_html(title: str, value: str, delta: str = None, delta_color: str = "positive") -> str:
+    """Build the HTML fragment for one metric card (no Streamlit call)."""
+    delta_html = ""
+    if delta:
+        delta_class = f"metric-delta {delta_color}"
+        delta_html = f'<div class="{delta_class}">{delta}</div>'
+
+    return f"""
+    <div class="metric-card fade-in">
+        <div class="metric-label">{title}</div>
+        <div class="metric-value">{value}</div>
+        {delta_html}
+    </div>
+    """
+
+
+def _platform_badge_html(platform: str) -> str:
+    """Build the HTML fragment for one platform badge."""
+    return f'<span class="platform-badge {platform.lower()}">{platform}</span>'
+
+
+def _archetype_badge_html(archetype: str) -> str:
+    """Build the HTML fragment for one archetype badge."""
+    return f'<span class="archetype-badge {archetype}">{archetype}</span>'
+
+
 def metric_card(title: str, value: str, delta: str = None, delta_color: str = "positive"):
     """
     Display a custom metric card with purple theme.
@@ -582,32 +653,52 @@ def metric_card(title: str, value: str, delta: str = None, delta_color: str = "p
         delta: Optional delta/change indicator
         delta_color: "positive" or "negative"
     """
-    delta_html = ""
-    if delta:
-        delta_class = f"metric-delta {delta_color}"
-        delta_html = f'<div class="{delta_class}">{delta}</div>'
+    st.markdown(_metric_html(title, value, delta, delta_color), unsafe_allow_html=True)
 
-    st.markdown(f"""
-    <div class="metric-card fade-in">
-        <div class="metric-label">{title}</div>
-        <div class="metric-value">{value}</div>
-        {delta_html}
-    </div>
-    """, unsafe_allow_html=True)
+
+def render_metrics_row(metrics: list):
+    """
+    Display several metric cards as ONE Streamlit element.
+
+    Each st.markdown call crosses the websocket as its own delta; a
+    dashboard row of N cards rendered through metric_card costs N
+    round-trips. This concatenates the cards into a single flex-row
+    markdown call.
+
+    Args:
+        metrics: List of dicts with metric_card's keyword arguments
+    """
+    html = (
+        '<div style="display:flex;gap:10px">'
+        + ''.join(_metric_html(**m) for m in metrics)
+        + '</div>'
+    )
+    st.markdown(html, unsafe_allow_html=True)
 
 
 def platform_badge(platform: str):
     """Display a platform badge (LinkedIn, Facebook, Instagram)."""
-    platform_lower = platform.lower()
-    st.markdown(
-        f'<span class="platform-badge {platform_lower}">{platform}</span>',
-        unsafe_allow_html=True
-    )
+    st.markdown(_platform_badge_html(platform), unsafe_allow_html=True)
 
 
 def archetype_badge(archetype: str):
     """Display an archetype badge (Heart, Head, Hands)."""
-    st.markdown(
-        f'<span class="archetype-badge {archetype}">{archetype}</span>',
-        unsafe_allow_html=True
-    )
+    st.markdown(_archetype_badge_html(archetype), unsafe_allow_html=True)
+
+
+def render_badges(pairs: list):
+    """
+    Display platform/archetype badge pairs as ONE Streamlit element.
+
+    Args:
+        pairs: List of (platform, archetype) tuples; either half may be
+            None to render just the other badge
+    """
+    parts = []
+    for platform, archetype in pairs:
+        if platform:
+            parts.append(_platform_badge_html(platform))
+        if archetype:
+            parts.append(_archetype_badge_html(archetype))
+    html = '<div style="display:flex;gap:8px;align-items:center">' + ''.join(parts) + '</div>'
+    st.markdown(html, unsafe_allow_html=True)